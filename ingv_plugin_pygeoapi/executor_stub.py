@@ -0,0 +1,239 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+"""
+Local stand-in of an executor service, for development and testing.
+
+It implements the interface described in the README ('POST /execute',
+'GET /job_info/<job_id>') without running any real code: each job lasts
+`--duration` seconds and ends with `--exit-code`. If `--fixtures` is given,
+the files in that directory are copied in the job working directory
+(`--private-dir`/<job_id>), to simulate the files produced by the code.
+
+When the request contains 'application_params.callback_url', the final
+'job_info' is POSTed to that URL at the end of the job.
+
+The batched status request 'GET /job_info?ids=<id1>,<id2>,...' is
+supported, unless `--no-batch` is given.
+
+    python -m ingv_plugin_pygeoapi.executor_stub --port 5001 \\
+        --private-dir /custom_process_dir/conduit --fixtures ./conduit_out
+"""
+
+import argparse
+import json
+import logging
+import shutil
+import threading
+import time
+import urllib.request
+
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+class StubExecutor:
+    """Jobs of the stand-in executor"""
+    def __init__(self, duration: float = 1.0, exit_code: int = 0,
+                 private_dir: str = None, fixtures: str = None,
+                 batch: bool = True):
+        self.duration = duration
+        self.batch = batch
+        self.exit_code = exit_code
+        self.private_dir = Path(private_dir) if private_dir else None
+        self.fixtures = Path(fixtures) if fixtures else None
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def submit(self, request: dict) -> dict:
+        application_params = request['application_params']
+        job_id = application_params['job_id']
+        info = {
+            'job_id': job_id,
+            'job_info': {
+                'received': _now(),
+                'start_processing': None,
+                'end_processing': None,
+                'exit_code': None,
+                'std_out': '',
+                'std_err': ''
+            },
+            'params': request.get('code_input_params', {})
+        }
+        with self.lock:
+            self.jobs[job_id] = info
+
+        callback_url = application_params.get('callback_url')
+        if application_params.get('synch_execution', True):
+            self._run(info, callback_url)
+        else:
+            threading.Thread(target=self._run, args=(info, callback_url),
+                             daemon=True).start()
+        return info
+
+    def job_info(self, job_id: str):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def _run(self, info: dict, callback_url: str = None) -> None:
+        job_info = info['job_info']
+        job_info['start_processing'] = _now()
+        time.sleep(self.duration)
+
+        if self.private_dir is not None and self.fixtures is not None:
+            shutil.copytree(self.fixtures,
+                            self.private_dir / info['job_id'],
+                            dirs_exist_ok=True)
+
+        job_info['exit_code'] = self.exit_code
+        if self.exit_code != 0:
+            job_info['std_err'] = 'Stub executor: simulated failure'
+        job_info['end_processing'] = _now()
+
+        if callback_url:
+            request = urllib.request.Request(
+                callback_url, data=json.dumps(info).encode('utf-8'),
+                headers={'Content-Type': 'application/json'},
+                method='POST')
+            try:
+                with urllib.request.urlopen(request, timeout=10):
+                    pass
+            except OSError as err:
+                LOGGER.warning(f'Callback to {callback_url} failed: {err}')
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    # keep-alive, come un servizio reale
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        if urlsplit(self.path).path != '/execute':
+            self._reply(HTTPStatus.NOT_FOUND, {'Message': 'Unknown path'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length))
+            info = self.server.executor.submit(request)
+        except (ValueError, KeyError, TypeError) as err:
+            self._reply(HTTPStatus.BAD_REQUEST,
+                        {'Message': f'Wrong request: {err}'})
+            return
+        self._reply(HTTPStatus.OK, info)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path
+        if path == '/job_info' and self.server.executor.batch:
+            job_ids = parse_qs(url.query).get('ids', [''])[0].split(',')
+            infos = [info for info in map(self.server.executor.job_info,
+                                          job_ids) if info is not None]
+            self._reply(HTTPStatus.OK, {'jobs': infos})
+            return
+        if not path.startswith('/job_info/'):
+            self._reply(HTTPStatus.NOT_FOUND, {'Message': 'Unknown path'})
+            return
+        info = self.server.executor.job_info(
+            unquote(path[len('/job_info/'):]))
+        if info is None:
+            self._reply(HTTPStatus.NOT_FOUND, {'Message': 'Unknown job'})
+            return
+        self._reply(HTTPStatus.OK, info)
+
+    def _reply(self, status: HTTPStatus, content) -> None:
+        body = json.dumps(content).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        LOGGER.info(format % args)
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def make_server(host: str, port: int,
+                executor: StubExecutor) -> ThreadingHTTPServer:
+    """
+    Create (not start) the HTTP server of the stand-in executor
+
+    :param host: address to listen on
+    :param port: port to listen on (0: any free port)
+    :param executor: `StubExecutor` handling the jobs
+
+    :returns: `ThreadingHTTPServer`
+    """
+    server = _StubServer((host, port), _StubHandler)
+    server.executor = executor
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Stand-in executor for ingv_plugin_pygeoapi')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5001)
+    parser.add_argument('--duration', type=float, default=1.0,
+                        help='seconds each job lasts')
+    parser.add_argument('--exit-code', type=int, default=0)
+    parser.add_argument('--private-dir',
+                        help='private_processor_dir of the processor')
+    parser.add_argument('--fixtures',
+                        help='directory with the files produced by a job')
+    parser.add_argument('--no-batch', action='store_true',
+                        help='do not support GET /job_info?ids=...')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    executor = StubExecutor(args.duration, args.exit_code,
+                            args.private_dir, args.fixtures,
+                            batch=not args.no_batch)
+    server = make_server(args.host, args.port, executor)
+    LOGGER.info(f'Stub executor listening on {args.host}:{args.port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
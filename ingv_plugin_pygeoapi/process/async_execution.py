@@ -0,0 +1,202 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import asyncio
+import atexit
+import logging
+import threading
+import weakref
+
+from typing import Any, Coroutine
+
+from pygeoapi.process.base import (
+    ProcessorExecuteError,
+    ProcessorGenericError
+)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+LOGGER = logging.getLogger(__name__)
+
+# Timeout (secondi) della sola connessione all'executor: come per la
+# sessione sincrona, la durata della richiesta non è limitata, perché
+# una POST /execute sincrona dura quanto il job.
+CONNECT_TIMEOUT = 30
+
+
+class EventLoopThread:
+    """asyncio event loop running in a daemon thread"""
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever,
+                                        name='remote-execution-loop',
+                                        daemon=True)
+        self._thread.start()
+
+    def run(self, coro: Coroutine) -> Any:
+        """
+        Run the coroutine on the loop, blocking the calling thread
+        until it is completed
+
+        :param coro: coroutine to run
+
+        :returns: the result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+# Un solo event loop per processo pygeoapi supervisiona tutti i job
+_LOOP_THREAD = None
+_LOOP_LOCK = threading.Lock()
+
+
+def get_event_loop_thread() -> EventLoopThread:
+    global _LOOP_THREAD
+    with _LOOP_LOCK:
+        if _LOOP_THREAD is None:
+            _LOOP_THREAD = EventLoopThread()
+            atexit.register(_close_async_sessions)
+    return _LOOP_THREAD
+
+
+def _close_async_sessions() -> None:
+    # Solo le sessioni del loop condiviso: quelle degli altri loop sono
+    # di chi li ha creati.
+    async def close_all():
+        with _ASYNC_SESSIONS_LOCK:
+            sessions = _ASYNC_SESSIONS.pop(_LOOP_THREAD.loop, {})
+        for session in sessions.values():
+            await session.close()
+
+    _LOOP_THREAD.run(close_all())
+
+
+# Sessioni aiohttp per event loop e per url_executor: una sessione può
+# essere usata solo nel loop in cui è stata creata (il loop condiviso,
+# o quello da cui è chiamato direttamente execute_async()).
+_ASYNC_SESSIONS = weakref.WeakKeyDictionary()
+_ASYNC_SESSIONS_LOCK = threading.Lock()
+
+
+def check_async_support() -> None:
+    if aiohttp is None:
+        raise ProcessorGenericError(
+            '\'asyncio_execution\' requires the \'aiohttp\' package.')
+
+
+def get_async_session(url_executor: str,
+                      pool_maxsize: int = 100) -> 'aiohttp.ClientSession':
+    """
+    Return the aiohttp session shared by every job calling `url_executor`
+    from the running event loop
+
+    Must be called from a coroutine: each loop has its own sessions.
+
+    :param url_executor: base URL of the executor
+    :param pool_maxsize: max number of connections kept alive
+
+    :returns: `aiohttp.ClientSession`
+    """
+    loop = asyncio.get_running_loop()
+    key = (url_executor, pool_maxsize)
+    with _ASYNC_SESSIONS_LOCK:
+        sessions = _ASYNC_SESSIONS.setdefault(loop, {})
+        session = sessions.get(key)
+        if session is None or session.closed:
+            LOGGER.debug(f'New aiohttp session for executor {url_executor}')
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=pool_maxsize),
+                timeout=aiohttp.ClientTimeout(total=None,
+                                              sock_connect=CONNECT_TIMEOUT)
+            )
+            sessions[key] = session
+    return session
+
+
+async def close_async_sessions() -> None:
+    """
+    Close the aiohttp sessions created in the running event loop
+
+    To be awaited by code calling `execute_async()` from its own loop,
+    before the loop is closed.
+    """
+    with _ASYNC_SESSIONS_LOCK:
+        sessions = _ASYNC_SESSIONS.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        await session.close()
+
+
+async def request_json(session: 'aiohttp.ClientSession', method: str,
+                       url: str, max_retries: int = 3,
+                       backoff_factor: float = 0.5, **kwargs):
+    """
+    HTTP request returning the status and the JSON content of the response
+
+    As for the synchronous session, POST is retried only on connection
+    errors; GET is retried also on 502/503/504 responses.
+
+    :returns: tuple (ok, status, content); content is `None` if the
+              response is not JSON
+
+    :raises ProcessorExecuteError: if the request fails once the retries
+                                   are exhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                retryable = (method == 'GET'
+                             and response.status in (502, 503, 504))
+                if not retryable or attempt >= max_retries:
+                    try:
+                        content = await response.json(content_type=None)
+                    except ValueError:
+                        content = None
+                    return response.ok, response.status, content
+        except (aiohttp.ClientConnectorError,
+                aiohttp.ServerTimeoutError) as err:
+            # the request never reached the executor (only the connection
+            # has a timeout)
+            if attempt >= max_retries:
+                raise _request_error(method, url, err) from err
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            if method != 'GET' or attempt >= max_retries:
+                raise _request_error(method, url, err) from err
+        await asyncio.sleep(backoff_factor * (2 ** attempt))
+        attempt += 1
+
+
+def _request_error(method: str, url: str,
+                   err: BaseException) -> ProcessorExecuteError:
+    message = f'{method} {url} failed: {type(err).__name__}: {err}'
+    LOGGER.error(message)
+    return ProcessorExecuteError(message)
@@ -27,13 +27,14 @@
 #
 # =================================================================
 
+import asyncio
 import logging
 import os
-from typing import Any, Optional, Tuple
-import requests
+from typing import Any, Callable, Optional, Tuple
 import shutil
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urljoin
 
@@ -42,6 +43,45 @@ from pygeoapi.process.base import (
     ProcessorExecuteError,
     ProcessorGenericError,
 )
+from ingv_plugin_pygeoapi.process.async_execution import (
+    check_async_support,
+    get_async_session,
+    get_event_loop_thread,
+    request_json
+)
+from ingv_plugin_pygeoapi.process.callback import (
+    JobWaiter,
+    get_callback_listener,
+    register_waiter,
+    unregister_waiter
+)
+from ingv_plugin_pygeoapi.process.downsampling import (
+    downsample_chart,
+    requested_max_points
+)
+from ingv_plugin_pygeoapi.process.executor_session import (
+    get_executor_session
+)
+from ingv_plugin_pygeoapi.process.job_poller import (
+    get_job_status_poller
+)
+from ingv_plugin_pygeoapi.process.polling import (
+    FixedPollingStrategy,
+    PollingStrategy,
+    resolve_polling_strategy
+)
+from ingv_plugin_pygeoapi.process.result_cache import ResultCache, job_key
+from ingv_plugin_pygeoapi.process.result_store import ResultStore
+from ingv_plugin_pygeoapi.process.serialization import (
+    encode_chart_values,
+    get_json_serializer,
+    requested_binary_values,
+    to_builtin
+)
+from ingv_plugin_pygeoapi.process.single_flight import (
+    join_flight, land_flight)
+from ingv_plugin_pygeoapi.process.streaming import open_stream
+from ingv_plugin_pygeoapi.process.validation import get_input_validator
 
 LOGGER = logging.getLogger(__name__)
 
@@ -77,25 +117,261 @@ class BaseRemoteExecutionProcessor(BaseProcessor):
 
         self.private_processor_dir = Path(self.private_processor_dir)
 
-        self.polling_time = processor_def.get('polling_time', 3)
-#        self.max_waiting_loops = max(
-#            0, int(processor_def.get('max_waiting_loops', 1))
-#        )
+        self.processor_def = processor_def
+
+        # Validatore degli input, compilato una sola volta dagli schemi
+        # della descrizione del processo
+        self.input_validator = get_input_validator(self.metadata)
+        # Testo degli input tabellari validati, per prepare_input()
+        self.input_tables = {}
+
+        # Tempo massimo (secondi) di attesa di un job asincrono;
+        # None: attesa senza limite
+        self.max_waiting_time = processor_def.get('max_waiting_time')
+        if self.max_waiting_time is not None:
+            self.max_waiting_time = float(self.max_waiting_time)
+
+        # Strategia di polling risolta e verificata qui, una sola volta:
+        # un errore di configurazione non deve emergere dopo che il job
+        # è già stato sottomesso all'executor.
+        self.polling_strategy_class = resolve_polling_strategy(
+            processor_def.get('polling_strategy', 'fixed'))
+        self.polling_strategy_class(processor_def, self.metadata['id'])
 
         self.remote_execute_synch = processor_def.get(
             'remote_execute_synch', True
         )
+
+        # Sessione HTTP (pool di connessioni keep-alive) condivisa
+        # da tutti i processor che usano lo stesso url_executor
+        self.max_retries = int(processor_def.get('max_retries', 3))
+        self.retry_backoff_factor = float(
+            processor_def.get('retry_backoff_factor', 0.5))
+        self.session = get_executor_session(
+            self.url_executor,
+            pool_maxsize=int(processor_def.get('pool_maxsize', 10)),
+            max_retries=self.max_retries,
+            backoff_factor=self.retry_backoff_factor,
+            pool_block=bool(processor_def.get('pool_block', False))
+        )
+
+        # Esecuzione asyncio: un solo event loop per tutti i job
+        self.asyncio_execution = bool(
+            processor_def.get('asyncio_execution', False))
+        self.async_pool_maxsize = int(
+            processor_def.get('async_pool_maxsize', 100))
+        if self.asyncio_execution:
+            check_async_support()
+
+        # Modalità di attesa dei job asincroni: 'polling' (job_info),
+        # 'shared_polling' (un solo poller per tutti i job dell'executor)
+        # oppure 'callback' (l'executor notifica la fine del job)
+        self.completion_mode = processor_def.get('completion_mode', 'polling')
+        if self.completion_mode not in ('polling', 'shared_polling',
+                                        'callback'):
+            raise ProcessorGenericError(
+                'Wrong \'completion_mode\' in configuration: '
+                f'{self.completion_mode}.')
+        self.callback_listener = None
+        self.callback_polling_time = float(
+            processor_def.get('callback_polling_time', 60))
+        if self.completion_mode == 'callback':
+            self.callback_listener = get_callback_listener(
+                processor_def.get('callback_bind_host', '0.0.0.0'),
+                int(processor_def.get('callback_bind_port', 0)),
+                public_url=processor_def.get('callback_url'),
+                public_host=processor_def.get('callback_host')
+            )
+        self.job_poller = None
+        if self.completion_mode == 'shared_polling':
+            self.job_poller = get_job_status_poller(
+                self.session, self.url_executor,
+                float(processor_def.get('polling_time', 3)),
+                int(processor_def.get('polling_max_failures', 5)))
+
+        # Cache dei risultati: i codici sono deterministici, richieste
+        # con gli stessi input restituiscono gli stessi output.
+        self.result_cache = None
+        if processor_def.get('result_cache', False):
+            ttl = processor_def.get('result_cache_ttl', 86400)
+            max_size_mb = processor_def.get('result_cache_max_mb', 1024)
+            self.result_cache = ResultCache(
+                self.private_processor_dir,
+                self.metadata['id'],
+                self.metadata['version'],
+                ttl=None if ttl is None else float(ttl),
+                max_size=(None if max_size_mb is None
+                          else int(float(max_size_mb) * 1024 * 1024))
+            )
+
+        # Store degli output trasmessi per riferimento ('reference'),
+        # servito da un web server esterno
+        self.result_store = None
+        result_store_dir = processor_def.get('result_store_dir')
+        if result_store_dir is not None:
+            result_store_url = processor_def.get('result_store_url')
+            if result_store_url is None:
+                raise ProcessorGenericError(
+                    'Undefined \'result_store_url\' in configuration.')
+            retention = processor_def.get('result_store_retention', 604800)
+            self.result_store = ResultStore(
+                result_store_dir, result_store_url,
+                retention=None if retention is None else float(retention))
+
+        # Richieste identiche contemporanee: un solo job remoto,
+        # il cui risultato è restituito a tutte le richieste
+        self.coalesce_requests = bool(
+            processor_def.get('coalesce_requests', False))
+
+        # Output prodotti a blocchi dai file, invece che caricati in
+        # memoria: richiede un job manager senza 'output_dir'
+        self.stream_outputs = bool(
+            processor_def.get('stream_outputs', False))
+
+        # Thread usati per preparare in parallelo gli output richiesti
+        self.output_workers = int(processor_def.get('output_workers', 4))
+
+        # Codifica JSON degli output: 'json' (libreria standard) oppure
+        # 'orjson'; float_precision: cifre significative delle serie
+        float_precision = processor_def.get('float_precision')
+        self.json_serializer = get_json_serializer(
+            processor_def.get('json_serializer', 'json'),
+            None if float_precision is None else int(float_precision))
+
+        # Numero massimo di punti delle serie dei grafici, se non
+        # indicato nella definizione dell'output; None: tutti i punti
+        self.max_points = processor_def.get('max_points')
+        if self.max_points is not None:
+            self.max_points = int(self.max_points)
+
         self.job_id = None
 
     def set_job_id(self, job_id: str) -> None:
         self.job_id = job_id
 
+    def chart_max_points(self, outputs, output_id: str) -> Optional[int]:
+        """
+        Max number of points of the series of a chart output
+
+        :param outputs: `outputs` parameter of `execute()`
+        :param output_id: id of the chart output
+
+        :returns: max number of points, `None` for all the points
+        """
+        return requested_max_points(outputs, output_id, self.max_points)
+
+    def check_chart_output(self, outputs, output_id: str) -> None:
+        """
+        Validate the parameters of the definition of a chart output
+
+        :param outputs: `outputs` parameter of `execute()`
+        :param output_id: id of the chart output
+        """
+        self.chart_max_points(outputs, output_id)
+        requested_binary_values(outputs, output_id)
+
+    def chart_value(self, chart: dict, outputs, output_id: str) -> dict:
+        """
+        Value of a 'chartType: line' output, as requested in its output
+        definition: series reduced to 'max_points', values encoded as
+        'binary_values'
+
+        :param chart: the chart, with the values as sequences or arrays
+        :param outputs: `outputs` parameter of `execute()`
+        :param output_id: id of the chart output
+
+        :returns: the chart
+        """
+        chart = downsample_chart(chart,
+                                 self.chart_max_points(outputs, output_id))
+        dtype = requested_binary_values(outputs, output_id)
+        if dtype is not None:
+            chart = encode_chart_values(chart, dtype)
+        return chart
+
+    def prepare_outputs_concurrently(self, builders: dict) -> dict:
+        """
+        Prepare independent outputs on a bounded thread pool
+
+        Reading, parsing and encoding the output files is mostly I/O or
+        C code (numpy, GDAL), that run in parallel in the threads.
+
+        :param builders: callables without arguments, producing each
+            output, by output id
+
+        :returns: the produced outputs, by output id, in the same order
+            as `builders`
+        """
+        workers = min(self.output_workers, len(builders))
+        if workers <= 1:
+            return {output_id: builder()
+                    for output_id, builder in builders.items()}
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix='prepare-output') as pool:
+            futures = {output_id: pool.submit(builder)
+                       for output_id, builder in builders.items()}
+            return {output_id: future.result()
+                    for output_id, future in futures.items()}
+
+    def json_result(self, value) -> Tuple[str, Any]:
+        """
+        Result of `prepare_output()` for a JSON value
+
+        With the default serializer the value is returned as Python
+        objects, encoded by pygeoapi; otherwise it is encoded by the
+        configured serializer, and returned as bytes with a media type
+        that pygeoapi does not encode again.
+
+        :param value: JSON value, possibly holding numpy arrays
+
+        :returns: mimetype and value
+        """
+        if self.json_serializer.native:
+            return 'application/json', to_builtin(value)
+        return ('application/json; charset=utf-8',
+                self.json_serializer.dumps(value))
+
+    def by_reference(self, outputs, output_id: str) -> bool:
+        """
+        Check if an output is requested with 'transmissionMode: reference'
+
+        :param outputs: `outputs` parameter of `execute()`
+        :param output_id: id of the output
+
+        :returns: `True` if the output must be published in the result store
+        """
+        if not (isinstance(outputs, dict)
+                and isinstance(outputs.get(output_id), dict)):
+            return False
+        if outputs[output_id].get('transmissionMode') != 'reference':
+            return False
+        if self.result_store is None:
+            raise ProcessorExecuteError(
+                f"Output '{output_id}' cannot be transmitted by reference.")
+        return True
+
+    def publish_output(self, path: Path, media_type: str) -> dict:
+        """
+        Move an output file to the result store
+
+        :param path: output file, in the working directory
+        :param media_type: media type of the file
+
+        :returns: the link to the file
+        """
+        return {
+            'href': self.result_store.publish(path),
+            'type': media_type
+        }
+
     def prepare_input(self, data, working_dir, outputs):
         """
         validate the input and prepare the objet to send to the 'code'
 
         :param data: inputs data received by the caller.
-        Data must be checked they match the metadata definition of 'inputs'.
+        Data are already checked against the schemas of the metadata
+        definition of 'inputs' (see `validation.InputValidator`): only the
+        rules the schemas cannot express must be checked here.
 
         NOTE: the logic to pass the received parameters to the 'code' is up
         to the specialised class.
@@ -152,11 +428,105 @@ class BaseRemoteExecutionProcessor(BaseProcessor):
 
     def execute(self, data: dict, outputs: Optional[dict] = None
                 ) -> Tuple[str, Any]:
+        if self.asyncio_execution:
+            # Sync shim: the manager thread waits, while submission and
+            # polling run in the event loop shared by all the jobs.
+            return get_event_loop_thread().run(
+                self.execute_async(data, outputs))
+
+        mimetype, process_outputs = self._execute_job(data, outputs)
+        # Un corpo prodotto a blocchi è restituito come iteratore, che il
+        # server invia senza caricarlo in memoria
+        return mimetype, open_stream(process_outputs)
+
+    def _execute_job(self, data: dict, outputs: Optional[dict]
+                     ) -> Tuple[str, Any]:
+        working_dir, code_input_params = self._prepare_job(data, outputs)
+
+        cache_key, cached = self._cached_result(
+            working_dir, code_input_params, outputs)
+        if cached is not None:
+            return cached
+
+        waiter = None
+        if self.coalesce_requests:
+            waiter, leader = join_flight(cache_key)
+            if not leader:
+                shutil.rmtree(working_dir)
+                return self._flight_result(
+                    waiter.wait(self.max_waiting_time))
+
+        try:
+            info = self.run_remote_job(self.job_id, working_dir,
+                                       code_input_params)
+            result = self._complete_job(info, working_dir, outputs,
+                                        cache_key)
+        except BaseException as err:
+            if waiter is not None:
+                self._land_flight(cache_key, waiter, error=err)
+            raise
+        if waiter is not None:
+            self._land_flight(cache_key, waiter, result=result)
+        return result
+
+    async def execute_async(self, data: dict, outputs: Optional[dict] = None
+                            ) -> Tuple[str, Any]:
+        """
+        asyncio variant of `execute()`
+
+        Submission and polling are done with non blocking HTTP calls,
+        so that one event loop can supervise many jobs; input and output
+        files are handled in the default executor, not to block the loop.
+        """
+        check_async_support()
+        mimetype, process_outputs = await self._execute_job_async(
+            data, outputs)
+        return mimetype, open_stream(process_outputs)
+
+    async def _execute_job_async(self, data: dict, outputs: Optional[dict]
+                                 ) -> Tuple[str, Any]:
+        loop = asyncio.get_running_loop()
+        working_dir, code_input_params = await loop.run_in_executor(
+            None, self._prepare_job, data, outputs)
+
+        cache_key, cached = await loop.run_in_executor(
+            None, self._cached_result, working_dir, code_input_params,
+            outputs)
+        if cached is not None:
+            return cached
+
+        waiter = None
+        if self.coalesce_requests:
+            waiter, leader = join_flight(cache_key)
+            if not leader:
+                await loop.run_in_executor(None, shutil.rmtree, working_dir)
+                return self._flight_result(
+                    await waiter.wait_async(self.max_waiting_time))
+
+        try:
+            info = await self.run_remote_job_async(self.job_id, working_dir,
+                                                   code_input_params)
+            result = await loop.run_in_executor(
+                None, self._complete_job, info, working_dir, outputs,
+                cache_key)
+        except BaseException as err:
+            if waiter is not None:
+                self._land_flight(cache_key, waiter, error=err)
+            raise
+        if waiter is not None:
+            self._land_flight(cache_key, waiter, result=result)
+        return result
+
+    def _prepare_job(self, data: dict, outputs: Optional[dict]
+                     ) -> Tuple[str, dict]:
         if not self.job_id:
             # should be happen only in testing
             raise ProcessorGenericError(
                 'Missing call to \'set_job_id()\' before \'execute()\'.')
 
+        # Richieste non valide sono rifiutate prima di creare la working dir
+        self.input_tables = self.input_validator(data)
+
         working_dir = str(self.private_processor_dir / self.job_id)
         os.mkdir(working_dir, mode=0o755)
 
@@ -166,55 +536,29 @@ class BaseRemoteExecutionProcessor(BaseProcessor):
             shutil.rmtree(working_dir)
             raise ex
 
-        # Call the processing server, always synch:
-        execute_url = urljoin(self.url_executor, "execute")
-        headers = {'Content-type': 'application/json'}
-        response = requests.post(execute_url, json={
-          'application_params': {
-              'job_id': self.job_id,
-              'synch_execution': self.remote_execute_synch
-          },
-          'code_input_params': code_input_params},
-          headers=headers
-        )
-        if not response.ok:
-            try:
-                # Unaccepted request: the dir and files are useless:
-                shutil.rmtree(working_dir)
-                # Get returned message
-                message = response.json()['Message']
-                raise ProcessorExecuteError(message)
-            except Exception:
-                # If no returned message, get exception message
-                raise ProcessorExecuteError(response)
-
-        # Nota: siccome response.ok, allora il thread è sicuramente partito,
-        # alternativamente avrebbe risposto con un abort().
-
-        if self.remote_execute_synch:
-            info = response.json()
-        else:
-            # Aspetta attivamente (con sleep) che il 'code' sia terminato
-#            max_waiting_loops = self.max_waiting_loops + 1
-#            while (max_waiting_loops := max_waiting_loops-1) > 0:
-            while True:
-                time.sleep(self.polling_time)
-                execute_url = urljoin(
-                    self.url_executor, "job_info/" + self.job_id
-                )
-                response = requests.get(execute_url)
-                if not response.ok:
-                    try:
-                        shutil.rmtree(working_dir)
-                        message = response.json()['Message']
-                        raise ProcessorExecuteError(message)
-                    except Exception:
-                        raise ProcessorExecuteError(response)
-                    
-                info = response.json()
-                if info['job_info']['end_processing']:
-                    break
+        return working_dir, code_input_params
+
+    def _cached_result(self, working_dir: str, code_input_params: dict,
+                       outputs: Optional[dict]
+                       ) -> Tuple[Optional[str], Optional[Tuple[str, Any]]]:
+        # Restituisce la chiave del job (usata dalla cache dei risultati
+        # e per unire le richieste identiche) e, se presente nella cache,
+        # il risultato già calcolato.
+        if self.result_cache is None and not self.coalesce_requests:
+            return None, None
+        cache_key = job_key(self.metadata['id'], self.metadata['version'],
+                            code_input_params, working_dir, outputs)
+        if self.result_cache is None:
+            return cache_key, None
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            # The 'code' is not executed: the input files are useless
+            shutil.rmtree(working_dir)
+        return cache_key, cached
 
+    def _complete_job(self, info: dict, working_dir: str,
+                      outputs: Optional[dict],
+                      cache_key: Optional[str] = None) -> Tuple[str, Any]:
         if info['job_info']['exit_code'] != 0:
             error_msg = (
                 f"The job '{info['job_id']}' exited with code: "
@@ -235,7 +579,390 @@ class BaseRemoteExecutionProcessor(BaseProcessor):
         # content of working_dir no more usefull
         shutil.rmtree(working_dir)
 
+        if self.result_cache is not None:
+            self.result_cache.put(cache_key, (mimetype, process_outputs))
+
         return mimetype, process_outputs
 
+    def _land_flight(self, key: str, waiter, result=None,
+                     error: BaseException = None) -> None:
+        # Pubblica l'esito del job alle richieste identiche in attesa
+        if error is not None and not isinstance(error, Exception):
+            # e.g. KeyboardInterrupt, CancelledError: not to be propagated
+            error = ProcessorExecuteError(
+                f"The job '{self.job_id}' was interrupted.")
+        land_flight(key, waiter, result=result, error=error)
+
+    def _flight_result(self, result: Optional[Tuple[str, Any]]
+                       ) -> Tuple[str, Any]:
+        # Risultato del job di una richiesta identica a cui ci si è uniti
+        if result is None:
+            raise self._waiting_timeout(self.job_id)
+        return result
+
+    def run_remote_job(self, job_id: str, working_dir: str,
+                       code_input_params: dict) -> dict:
+        """
+        Submit the job to the executor and wait for its completion
+
+        :param job_id: job identifier
+        :param working_dir: working directory of the job
+        :param code_input_params: parameters to be passed to the 'code'
+
+        :returns: the final 'job_info' response
+        """
+        application_params = {
+            'job_id': job_id,
+            'synch_execution': self.remote_execute_synch
+        }
+
+        # In modalità callback l'executor notifica la fine del job:
+        # l'attesa deve essere registrata prima della sottomissione.
+        waiter = None
+        if (self.callback_listener is not None
+                and not self.remote_execute_synch):
+            waiter = register_waiter(job_id)
+            application_params['callback_url'] = \
+                self.callback_listener.url_for(waiter)
+
+        try:
+            # Call the processing server
+            execute_url = urljoin(self.url_executor, "execute")
+            headers = {'Content-type': 'application/json'}
+            response = self.session.post(execute_url, json={
+              'application_params': application_params,
+              'code_input_params': code_input_params},
+              headers=headers
+            )
+            if not response.ok:
+                # Unaccepted request: the dir and files are useless:
+                shutil.rmtree(working_dir)
+                raise self._executor_error(response)
+
+            # Nota: siccome response.ok, allora il thread è sicuramente
+            # partito, alternativamente avrebbe risposto con un abort().
+
+            if self.remote_execute_synch:
+                return response.json()
+            if self.job_poller is not None:
+                return self.wait_for_job_poller(job_id, working_dir)
+            return self.wait_for_completion(job_id, working_dir, waiter)
+        finally:
+            if waiter is not None:
+                unregister_waiter(job_id)
+
+    def run_remote_jobs(self, jobs: list, workers: int,
+                        run: Optional[Callable] = None) -> list:
+        """
+        Run several jobs at a time, e.g. the runs of a parameter sweep
+
+        At most `workers` jobs are submitted to the executor at the same
+        time; at the first failure the jobs not yet submitted are
+        cancelled and the error is raised.
+
+        :param jobs: `(job_id, working_dir, code_input_params)` tuples,
+            or the arguments of `run`
+        :param workers: max number of jobs running at the same time
+        :param run: function running one job, default `run_remote_job()`
+
+        :returns: the final 'job_info' responses (the results of `run`),
+            in the order of `jobs`
+        """
+        run = run or self.run_remote_job
+        workers = max(1, min(workers, len(jobs)))
+        pool = ThreadPoolExecutor(max_workers=workers,
+                                  thread_name_prefix='remote-job')
+        try:
+            futures = [pool.submit(run, *job) for job in jobs]
+            return [future.result() for future in futures]
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def create_polling_strategy(self) -> PollingStrategy:
+        """
+        Create the strategy deciding the delay between 'job_info' calls.
+
+        Specialised classes may override it to use their own strategy,
+        otherwise it is defined by `polling_strategy` in configuration.
+
+        :returns: `PollingStrategy`
+        """
+        return self.polling_strategy_class(self.processor_def,
+                                           self.metadata['id'])
+
+    def get_job_info(self, job_id: str) -> dict:
+        """
+        Ask the executor the status of the job
+
+        :param job_id: job identifier
+
+        :returns: `dict` with 'job_id', 'job_info' and 'params'
+        """
+        job_info_url = urljoin(self.url_executor, "job_info/" + job_id)
+        response = self.session.get(job_info_url)
+        if not response.ok:
+            raise self._executor_error(response)
+        return response.json()
+
+    def wait_for_completion(self, job_id: str, working_dir: str,
+                            waiter: Optional[JobWaiter] = None) -> dict:
+        """
+        Wait for the job, submitted asynchronously, to be completed
+
+        The delay between polls is decided by the polling strategy;
+        if `max_waiting_time` is configured, the wait is interrupted
+        once it is elapsed.
+
+        With a `waiter` the thread is woken up by the executor callback;
+        'job_info' is still polled every `callback_polling_time` seconds,
+        in case the callback is lost.
+
+        :param job_id: job identifier
+        :param working_dir: working directory of the job
+        :param waiter: `JobWaiter` registered for the callback, if any
+
+        :returns: the final 'job_info' response
+        """
+        strategy = self._waiting_strategy(waiter)
+        deadline = self._waiting_deadline()
+
+        info = None
+        attempt = 0
+        # Aspetta attivamente (con sleep) che il 'code' sia terminato
+        while True:
+            delay = self._next_delay(job_id, strategy, deadline,
+                                     attempt, info)
+
+            if waiter is None:
+                time.sleep(delay)
+            else:
+                info = waiter.wait(delay)
+                if info is not None:
+                    return info
+
+            try:
+                info = self.get_job_info(job_id)
+            except ProcessorExecuteError:
+                shutil.rmtree(working_dir)
+                raise
+            attempt += 1
+
+            if info['job_info']['end_processing']:
+                strategy.job_completed(info)
+                return info
+
+    def wait_for_job_poller(self, job_id: str, working_dir: str) -> dict:
+        """
+        Wait for the job to be reported as completed by the shared poller
+
+        :param job_id: job identifier
+        :param working_dir: working directory of the job
+
+        :returns: the final 'job_info' response
+        """
+        waiter = self.job_poller.subscribe(job_id)
+        try:
+            info = waiter.wait(self.max_waiting_time)
+        except ProcessorExecuteError:
+            shutil.rmtree(working_dir)
+            raise
+        finally:
+            self.job_poller.unsubscribe(job_id)
+        if info is None:
+            raise self._waiting_timeout(job_id)
+        return info
+
+    async def wait_for_job_poller_async(self, job_id: str,
+                                        working_dir: str) -> dict:
+        """
+        asyncio variant of `wait_for_job_poller()`
+        """
+        waiter = self.job_poller.subscribe(job_id)
+        try:
+            info = await waiter.wait_async(self.max_waiting_time)
+        except ProcessorExecuteError:
+            await asyncio.get_running_loop().run_in_executor(
+                None, shutil.rmtree, working_dir)
+            raise
+        finally:
+            self.job_poller.unsubscribe(job_id)
+        if info is None:
+            raise self._waiting_timeout(job_id)
+        return info
+
+    async def run_remote_job_async(self, job_id: str, working_dir: str,
+                                   code_input_params: dict) -> dict:
+        """
+        asyncio variant of `run_remote_job()`
+        """
+        application_params = {
+            'job_id': job_id,
+            'synch_execution': self.remote_execute_synch
+        }
+
+        waiter = None
+        if (self.callback_listener is not None
+                and not self.remote_execute_synch):
+            waiter = register_waiter(job_id)
+            application_params['callback_url'] = \
+                self.callback_listener.url_for(waiter)
+
+        try:
+            session = get_async_session(self.url_executor,
+                                        self.async_pool_maxsize)
+            try:
+                ok, status, content = await request_json(
+                    session, 'POST', urljoin(self.url_executor, "execute"),
+                    max_retries=self.max_retries,
+                    backoff_factor=self.retry_backoff_factor,
+                    json={
+                        'application_params': application_params,
+                        'code_input_params': code_input_params
+                    }
+                )
+            except ProcessorExecuteError:
+                # Failed request: no response will use the dir and files
+                await asyncio.get_running_loop().run_in_executor(
+                    None, shutil.rmtree, working_dir, True)
+                raise
+            if not ok:
+                # Unaccepted request: the dir and files are useless:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, shutil.rmtree, working_dir)
+                raise self._executor_error_async(status, content)
+
+            if self.remote_execute_synch:
+                return content
+            if self.job_poller is not None:
+                return await self.wait_for_job_poller_async(
+                    job_id, working_dir)
+            return await self.wait_for_completion_async(
+                job_id, working_dir, waiter)
+        finally:
+            if waiter is not None:
+                unregister_waiter(job_id)
+
+    async def run_remote_jobs_async(self, jobs: list, workers: int,
+                                    run: Optional[Callable] = None) -> list:
+        """
+        asyncio variant of `run_remote_jobs()`
+        """
+        run = run or self.run_remote_job_async
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def run_bounded(job):
+            async with semaphore:
+                return await run(*job)
+
+        tasks = [asyncio.create_task(run_bounded(job)) for job in jobs]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # at the first failure the other jobs are cancelled
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def get_job_info_async(self, job_id: str) -> dict:
+        """
+        asyncio variant of `get_job_info()`
+        """
+        session = get_async_session(self.url_executor,
+                                    self.async_pool_maxsize)
+        ok, status, content = await request_json(
+            session, 'GET', urljoin(self.url_executor, "job_info/" + job_id),
+            max_retries=self.max_retries,
+            backoff_factor=self.retry_backoff_factor
+        )
+        if not ok:
+            raise self._executor_error_async(status, content)
+        return content
+
+    async def wait_for_completion_async(
+            self, job_id: str, working_dir: str,
+            waiter: Optional[JobWaiter] = None) -> dict:
+        """
+        asyncio variant of `wait_for_completion()`
+        """
+        strategy = self._waiting_strategy(waiter)
+        deadline = self._waiting_deadline()
+
+        info = None
+        attempt = 0
+        while True:
+            delay = self._next_delay(job_id, strategy, deadline,
+                                     attempt, info)
+
+            if waiter is None:
+                await asyncio.sleep(delay)
+            else:
+                info = await waiter.wait_async(delay)
+                if info is not None:
+                    return info
+
+            try:
+                info = await self.get_job_info_async(job_id)
+            except ProcessorExecuteError:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, shutil.rmtree, working_dir)
+                raise
+            attempt += 1
+
+            if info['job_info']['end_processing']:
+                strategy.job_completed(info)
+                return info
+
+    def _waiting_strategy(self, waiter: Optional[JobWaiter]
+                          ) -> PollingStrategy:
+        if waiter is None:
+            return self.create_polling_strategy()
+        return FixedPollingStrategy(
+            {'polling_time': self.callback_polling_time},
+            self.metadata['id'])
+
+    def _waiting_deadline(self) -> Optional[float]:
+        if self.max_waiting_time is None:
+            return None
+        return time.monotonic() + self.max_waiting_time
+
+    def _next_delay(self, job_id: str, strategy: PollingStrategy,
+                    deadline: Optional[float], attempt: int,
+                    info: Optional[dict]) -> float:
+        delay = strategy.next_delay(attempt, info)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise self._waiting_timeout(job_id)
+            delay = min(delay, remaining)
+        return delay
+
+    def _waiting_timeout(self, job_id: str) -> ProcessorExecuteError:
+        # do not remove working_dir: the job could be running
+        message = (
+            f"The job '{job_id}' did not complete within "
+            f"{self.max_waiting_time} seconds."
+        )
+        LOGGER.error(message)
+        return ProcessorExecuteError(message)
+
+    @staticmethod
+    def _executor_error_async(status: int, content) -> ProcessorExecuteError:
+        try:
+            message = content['Message']
+        except Exception:
+            message = f'<Response [{status}]>'
+        return ProcessorExecuteError(message)
+
+    @staticmethod
+    def _executor_error(response) -> ProcessorExecuteError:
+        # Get returned message
+        try:
+            message = response.json()['Message']
+        except Exception:
+            # If no returned message, get the response itself
+            message = str(response)
+        return ProcessorExecuteError(message)
+
     def __repr__(self):
         return f'<BaseRemoteExecutionProcessor> {self.name}'
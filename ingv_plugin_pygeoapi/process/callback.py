@@ -0,0 +1,260 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import asyncio
+import hmac
+import json
+import logging
+import secrets
+import socket
+import threading
+
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, quote, urlsplit
+
+LOGGER = logging.getLogger(__name__)
+
+CALLBACK_PATH = '/job_callback/'
+
+
+class JobWaiter:
+    """
+    A job waiting to be notified of its completion, by the executor
+    callback or by the shared poller
+    """
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.token = secrets.token_urlsafe(16)
+        self._event = threading.Event()
+        self._info = None
+        self._error = None
+        # futures di chi attende in un event loop asyncio
+        self._futures = []
+        self._lock = threading.Lock()
+
+    def deliver(self, info: dict) -> None:
+        """
+        Notify the completion of the job
+
+        :param info: the final 'job_info'
+        """
+        self._complete(info, None)
+
+    def fail(self, error: Exception) -> None:
+        """
+        Notify that the status of the job cannot be retrieved
+
+        :param error: exception raised to the waiting thread
+        """
+        self._complete(None, error)
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """
+        Wait for the notification
+
+        :param timeout: max seconds to wait, `None` to wait forever
+
+        :returns: the 'job_info' received, `None` on timeout
+        """
+        if self._event.wait(timeout):
+            return self._result()
+        return None
+
+    async def wait_async(self, timeout: Optional[float] = None
+                         ) -> Optional[dict]:
+        """
+        Wait for the notification without blocking the event loop
+
+        :param timeout: max seconds to wait, `None` to wait forever
+
+        :returns: the 'job_info' received, `None` on timeout
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._event.is_set():
+                return self._result()
+            self._futures.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if (loop, future) in self._futures:
+                    self._futures.remove((loop, future))
+                if not self._event.is_set():
+                    return None
+        return self._result()
+
+    def _complete(self, info: Optional[dict],
+                  error: Optional[Exception]) -> None:
+        with self._lock:
+            self._info = info
+            self._error = error
+            self._event.set()
+            futures, self._futures = self._futures, []
+        for loop, future in futures:
+            loop.call_soon_threadsafe(_set_future_result, future)
+
+    def _result(self) -> dict:
+        if self._error is not None:
+            raise self._error
+        return self._info
+
+
+def _set_future_result(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+# Job in attesa di callback, per job_id (condivisi da tutti i processor
+# del processo pygeoapi).
+_WAITERS = {}
+_WAITERS_LOCK = threading.Lock()
+
+
+def register_waiter(job_id: str) -> JobWaiter:
+    waiter = JobWaiter(job_id)
+    with _WAITERS_LOCK:
+        _WAITERS[job_id] = waiter
+    return waiter
+
+
+def unregister_waiter(job_id: str) -> None:
+    with _WAITERS_LOCK:
+        _WAITERS.pop(job_id, None)
+
+
+class _CallbackHandler(BaseHTTPRequestHandler):
+    """Receive 'POST /job_callback/<job_id>?token=...' from the executor"""
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if not url.path.startswith(CALLBACK_PATH):
+            self._reply(HTTPStatus.NOT_FOUND, 'Unknown path')
+            return
+
+        job_id = url.path[len(CALLBACK_PATH):]
+        token = parse_qs(url.query).get('token', [''])[0]
+        with _WAITERS_LOCK:
+            waiter = _WAITERS.get(job_id)
+        if waiter is None:
+            self._reply(HTTPStatus.NOT_FOUND, 'Unknown job')
+            return
+        if not hmac.compare_digest(token, waiter.token):
+            self._reply(HTTPStatus.FORBIDDEN, 'Wrong token')
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            info = json.loads(self.rfile.read(length))
+            if not info['job_info']['end_processing']:
+                raise ValueError('job not completed')
+        except (ValueError, KeyError, TypeError) as err:
+            self._reply(HTTPStatus.BAD_REQUEST, f'Wrong job_info: {err}')
+            return
+
+        waiter.deliver(info)
+        self._reply(HTTPStatus.OK, 'Received')
+
+    def _reply(self, status: HTTPStatus, message: str) -> None:
+        body = json.dumps({'Message': message}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        LOGGER.debug('callback listener: ' + format % args)
+
+
+class CallbackListener:
+    """HTTP server, in a daemon thread, receiving the executor callbacks"""
+    def __init__(self, bind_host: str, bind_port: int,
+                 public_url: Optional[str] = None,
+                 public_host: Optional[str] = None):
+        """
+        Initialize object and start serving
+
+        :param bind_host: address the server listens on
+        :param bind_port: port the server listens on (0: any free port)
+        :param public_url: base URL the executor must call, if the listener
+                           is behind a proxy
+        :param public_host: host name the executor must call, when
+                            `public_url` is not given
+        """
+        self.server = ThreadingHTTPServer((bind_host, bind_port),
+                                          _CallbackHandler)
+        self.server.daemon_threads = True
+
+        if public_url is None:
+            host = public_host or socket.getfqdn()
+            public_url = f'http://{host}:{self.server.server_address[1]}'
+        self.public_url = public_url.rstrip('/')
+
+        self._thread = threading.Thread(
+            target=self.server.serve_forever,
+            name=f'callback-listener-{self.server.server_address[1]}',
+            daemon=True
+        )
+        self._thread.start()
+        LOGGER.debug(f'Callback listener started on {self.public_url}')
+
+    def url_for(self, waiter: JobWaiter) -> str:
+        return (f'{self.public_url}{CALLBACK_PATH}{quote(waiter.job_id)}'
+                f'?token={waiter.token}')
+
+
+_LISTENERS = {}
+_LISTENERS_LOCK = threading.Lock()
+
+
+def get_callback_listener(bind_host: str, bind_port: int,
+                          public_url: Optional[str] = None,
+                          public_host: Optional[str] = None
+                          ) -> CallbackListener:
+    """
+    Return the listener on (`bind_host`, `bind_port`), starting it if needed
+
+    With `bind_port` 0 a single listener, on a free port, is shared by all
+    the processors of the pygeoapi process: each worker process gets its
+    own port, so the executor always calls back the waiting process.
+
+    :returns: `CallbackListener`
+    """
+    key = (bind_host, bind_port)
+    with _LISTENERS_LOCK:
+        listener = _LISTENERS.get(key)
+        if listener is None:
+            listener = CallbackListener(bind_host, bind_port,
+                                        public_url, public_host)
+            _LISTENERS[key] = listener
+    return listener
@@ -27,20 +27,44 @@
 #
 # =================================================================
 
+import asyncio
 import logging
+import os
 import re
 import copy
+import shutil
 
 from pathlib import Path
 
 from pygeoapi.process.base import (
     ProcessorExecuteError,
-    #    ProcessorGenericError,
+    ProcessorGenericError,
 )
 from ingv_plugin_pygeoapi.process.base_remote_execution import BaseRemoteExecutionProcessor
+from ingv_plugin_pygeoapi.process.numeric_io import load_fortran_table
+from ingv_plugin_pygeoapi.process.sweep import sweep_grid
 
 LOGGER = logging.getLogger(__name__)
 
+# Output di tipo 'chartType: line', ricavati dai valori numerici di duct.out
+CHART_OUTPUTS = {'grafico_1', 'grafico_2', 'grafico_3'}
+
+# Output delle esecuzioni con l'input 'sweep'
+SWEEP_OUTPUTS = {'sweep_summary', 'sweep_profiles'}
+
+# Numero massimo di valori di un intervallo {start, stop, num} dello
+# sweep, verificato dallo schema prima di ogni altro controllo
+SWEEP_MAX_NUM = 10000
+
+# Valori all'uscita del condotto (ultima riga di duct.out) riportati
+# per ogni esecuzione di uno sweep: nome -> colonna di duct.out
+SWEEP_SCALARS = {
+    'exit_gas_volume_fraction': 2,
+    'exit_gas_velocity': 3,
+    'exit_liquid_velocity': 4,
+    'exit_pressure': 5
+}
+
 #: Process metadata and description
 PROCESS_METADATA = {
     # process.yaml -> processSummary.yaml
@@ -119,6 +143,7 @@ PROCESS_METADATA = {
                             'fe2o3', 'feo', 'mno', 'mgo', 'cao', 'na2o', 'k2o',
                             'h2o', 'co2', 'b'
                         ],
+                        'additionalProperties': False,
                         'properties': {
                             'f': {
                                 'type': 'number',
@@ -242,11 +267,11 @@ PROCESS_METADATA = {
                                 'exclusiveMinimum': True,
                                 'exclusiveMaximum': True
                             },
-                            'nao2': {
+                            'na2o': {
                                 'type': 'number',
-                                'title': 'TBD: significato',
+                                'title': 'Na_2O',
                                 'description':
-                                    'TBD: spiegazione',
+                                    'Melt composition: Weight fraction of Na_2O',
                                 'minimum': 0.0,
                                 'maximum': 1.0,
                                 'exclusiveMinimum': True,
@@ -303,6 +328,7 @@ PROCESS_METADATA = {
                             'fe2o3', 'feo', 'mno', 'mgo', 'cao', 'na2o', 'k2o',
                             'h2o', 'co2', 'b', 'c', 'den'
                         ],
+                        'additionalProperties': False,
                         'properties': {
                             'f': {
                                 'type': 'number',
@@ -426,11 +452,11 @@ PROCESS_METADATA = {
                                 'exclusiveMinimum': True,
                                 'exclusiveMaximum': True
                             },
-                            'nao2': {
+                            'na2o': {
                                 'type': 'number',
-                                'title': 'TBD: significato',
+                                'title': 'Na_2O',
                                 'description':
-                                    'TBD: spiegazione',
+                                    'Melt composition: Weight fraction of Na_2O',
                                 'minimum': 0.0,
                                 'maximum': 1.0,
                                 'exclusiveMinimum': True,
@@ -496,6 +522,48 @@ PROCESS_METADATA = {
                     },
                 ]
             }
+        },
+        'sweep': {
+            'title': 'Parameter sweep',
+            'description':
+                'Values of one or more model parameters, each given as a '
+                'list of values or as a range {start, stop, num} of evenly '
+                'spaced values. CONDUIT is run for each combination of the '
+                'values, the other parameters being taken from '
+                '\'components\'.',
+            'minOccurs': 0,
+            'maxOccurs': 1,
+            'schema': {
+                'type': 'object',
+                'additionalProperties': {
+                    'oneOf': [
+                        {
+                            'type': 'array',
+                            'minItems': 1,
+                            'items': {
+                                'type': 'number'
+                            }
+                        },
+                        {
+                            'type': 'object',
+                            'required': ['start', 'stop', 'num'],
+                            'properties': {
+                                'start': {
+                                    'type': 'number'
+                                },
+                                'stop': {
+                                    'type': 'number'
+                                },
+                                'num': {
+                                    'type': 'integer',
+                                    'minimum': 1,
+                                    'maximum': SWEEP_MAX_NUM
+                                }
+                            }
+                        }
+                    ]
+                }
+            }
         }
     },
     'outputs': {
@@ -692,6 +760,58 @@ PROCESS_METADATA = {
                 'type': 'string',
                 'contentMediaType': 'text/csv'
             }
+        },
+        'sweep_summary': {
+            'title': 'Sweep results',
+            'description':
+                'Only with the \'sweep\' input: one row for each run, with '
+                'the swept parameters, the exit code of the run and the '
+                'values at the conduit exit.',
+            'schema': {
+                'contentMediaType': 'application/json',
+                'type': 'object',
+                'required': ['columns', 'rows'],
+                'properties': {
+                    'columns': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string'
+                        }
+                    },
+                    'rows': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'array',
+                            'items': {
+                                'type': ['number', 'null']
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        'sweep_profiles': {
+            'title': 'Sweep profiles',
+            'description':
+                'Only with the \'sweep\' input: for each run, the swept '
+                'parameters and the profiles along the conduit, as a '
+                '\'chartType: line\' value (null if the run failed).',
+            'schema': {
+                'contentMediaType': 'application/json',
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'required': ['parameters', 'profile'],
+                    'properties': {
+                        'parameters': {
+                            'type': 'object'
+                        },
+                        'profile': {
+                            'type': ['object', 'null']
+                        }
+                    }
+                }
+            }
         }
     },
     'links': [{
@@ -765,6 +885,180 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
         super().__init__(processor_def, PROCESS_METADATA)
         self.supports_outputs = True
 
+        # Esecuzioni di uno sweep: numero massimo, e quante sono inviate
+        # contemporaneamente all'executor
+        self.sweep_max_runs = int(processor_def.get('sweep_max_runs', 100))
+        self.sweep_workers = int(processor_def.get('sweep_workers', 4))
+
+    def _execute_job(self, data, outputs):
+        if 'sweep' not in data:
+            return super()._execute_job(data, outputs)
+
+        names, runs, jobs = self._prepare_sweep(data, outputs)
+        try:
+            infos = self.run_remote_jobs(jobs, self.sweep_workers)
+        except BaseException:
+            self._remove_sweep_dirs(jobs)
+            raise
+        return self._complete_sweep(names, runs, jobs, infos, outputs)
+
+    async def _execute_job_async(self, data, outputs):
+        if 'sweep' not in data:
+            return await super()._execute_job_async(data, outputs)
+
+        loop = asyncio.get_running_loop()
+        names, runs, jobs = await loop.run_in_executor(
+            None, self._prepare_sweep, data, outputs)
+        try:
+            infos = await self.run_remote_jobs_async(jobs,
+                                                     self.sweep_workers)
+        except BaseException:
+            await loop.run_in_executor(None, self._remove_sweep_dirs, jobs)
+            raise
+        return await loop.run_in_executor(
+            None, self._complete_sweep, names, runs, jobs, infos, outputs)
+
+    def _prepare_sweep(self, data, outputs):
+        # Valida lo sweep e prepara un job per ogni combinazione dei
+        # valori; i job hanno id '<job_id>_<n>' e la propria working dir.
+        if not self.job_id:
+            # should be happen only in testing
+            raise ProcessorGenericError(
+                'Missing call to \'set_job_id()\' before \'execute()\'.')
+        self.input_validator(data)
+
+        if bool(outputs):
+            requested_output = set(outputs.keys() if isinstance(outputs, dict) else outputs)
+            if requested_output - SWEEP_OUTPUTS:
+                err_msg = ('Outputs of a sweep must be '
+                           f"{' or '.join(sorted(SWEEP_OUTPUTS))}.")
+                raise ProcessorExecuteError(err_msg)
+        self.check_chart_output(outputs, 'sweep_profiles')
+
+        try:
+            components = data['components']['value']
+            sweep = data['sweep']['value']
+        except Exception as err:
+            err_msg = 'Input not correctly formatted: ' + str(err) + '\'.'
+            raise ProcessorExecuteError(err_msg)
+
+        names, runs = sweep_grid(sweep, self.sweep_max_runs)
+
+        # Tutte le esecuzioni sono validate prima di inviarne qualcuna.
+        # CONDUIT non ha file di input: la working dir non è usata.
+        jobs = []
+        for index, values in enumerate(runs):
+            run_components = {**components, **dict(zip(names, values))}
+            self.input_validator.check_input('components', run_components)
+            code_input_params = self.prepare_input(
+                {'components': {'value': run_components}}, None, None)
+            job_id = f'{self.job_id}_{index:04d}'
+            working_dir = str(self.private_processor_dir / job_id)
+            jobs.append((job_id, working_dir, code_input_params))
+
+        created = []
+        try:
+            for _, working_dir, _ in jobs:
+                os.mkdir(working_dir, mode=0o755)
+                created.append(working_dir)
+        except BaseException:
+            for working_dir in created:
+                shutil.rmtree(working_dir)
+            raise
+        return names, runs, jobs
+
+    @staticmethod
+    def _remove_sweep_dirs(jobs):
+        # Sweep interrotto (errore HTTP, timeout, job annullati): nessuna
+        # risposta userà le working dir delle esecuzioni.
+        for _, working_dir, _ in jobs:
+            shutil.rmtree(working_dir, ignore_errors=True)
+
+    def _complete_sweep(self, names, runs, jobs, infos, outputs):
+        # Una esecuzione fallita non interrompe lo sweep: la sua riga
+        # riporta l'exit code e valori nulli.
+        requested_outputs = outputs if bool(outputs) else {'sweep_summary'}
+
+        rows = []
+        profiles = []
+        for values, (job_id, working_dir, _), info in zip(runs, jobs, infos):
+            exit_code = info['job_info']['exit_code']
+            scalars = [None] * len(SWEEP_SCALARS)
+            profile = None
+            if exit_code != 0:
+                LOGGER.error(
+                    f"The job '{job_id}' exited with code: {exit_code}\n"
+                    f"Error message:\n{info['job_info']['std_err']}")
+                # do not remove working_dir for debugging purpose
+            else:
+                table = self._load_duct_table(
+                    (Path(working_dir) / 'duct.out').read_bytes())
+                if len(table):
+                    scalars = [float(table[-1, index])
+                               for index in SWEEP_SCALARS.values()]
+                if 'sweep_profiles' in requested_outputs:
+                    profile = self.chart_value(
+                        self._profile_chart(table), outputs, 'sweep_profiles')
+                # content of working_dir no more usefull
+                shutil.rmtree(working_dir)
+
+            rows.append([*values, exit_code, *scalars])
+            profiles.append({
+                'parameters': dict(zip(names, values)),
+                'profile': profile
+            })
+
+        produced_outputs = {}
+        if 'sweep_summary' in requested_outputs:
+            produced_outputs['sweep_summary'] = {
+                'value': {
+                    'columns': [*names, 'exit_code', *SWEEP_SCALARS],
+                    'rows': rows
+                },
+                'mediaType': 'application/json'
+            }
+        if 'sweep_profiles' in requested_outputs:
+            produced_outputs['sweep_profiles'] = {
+                'value': profiles,
+                'mediaType': 'application/json'
+            }
+        return self.json_result(produced_outputs)
+
+    @staticmethod
+    def _load_duct_table(content: bytes):
+        # Carico il set di valori restituiti dal programma: almeno 6
+        # colonne (x, non usata, gas volume fraction, gas velocity,
+        # liquid velocity, pressure) con esponenti in notazione Fortran;
+        # eventuali colonne successive non sono usate.
+        try:
+            return load_fortran_table(content, min_columns=6)
+        except ValueError as err:
+            raise ProcessorExecuteError(
+                f"Output file 'duct.out' not correctly formatted: {err}")
+
+    @staticmethod
+    def _profile_chart(table) -> dict:
+        # Tutti i profili lungo il condotto, in un unico grafico
+        def series(key, unit, index):
+            return {'key': key, 'label': key, 'unit': unit,
+                    'values': table[:, index]}
+
+        return {
+            'chartType': 'line',
+            'domain': {
+                'key': 'Conduit length',
+                'label': 'Conduit length',
+                'unit': 'm',
+                'values': table[:, 0]
+            },
+            'series': [
+                series('Gas volume fraction', '', 2),
+                series('Gas velocity', 'm/s', 3),
+                series('Liquid velocity', 'm/s', 4),
+                series('Pressure', 'Mpa', 5)
+            ]
+        }
+
 
     def prepare_output(self, info, working_dir, outputs):
         # Only one output:
@@ -775,21 +1069,9 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
         # but in this case the "product" is a string in URL format,
         # NOT the object/file that can be retrieved at the given URL.
 
-        # Questo è il mimetype dell'intero risultato, non dei singoli
-        # elementi del risultato che sono definiti nei metadati.
-        mimetype = 'application/json' 
-
         # Il file di output non è passato come parametro ma è fisso e definito
         # all'interno del codice, e viene lasciato nella working dir
 
-        # Carico il set di valori restituiti dal programma
-        x_vals = []
-        not_used = []
-        gas_volume_fraction = []
-        gas_velocity = []
-        liquid_velocity = []
-        pressure = []
-
         possible_outputs = self.metadata['outputs']
 
         if not bool(outputs):
@@ -797,23 +1079,19 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
         else:
             requested_outputs = outputs
 
+        # Il file è letto una sola volta: lo stesso buffer è usato sia per
+        # i grafici sia per l'output 'csv'
         out_file_name = 'duct.out'
-        with open(str(Path(working_dir) / out_file_name), mode='r'
-                  ) as output_file:
-            for line in output_file:
-                # Rimuovi spazi e usa split per separare i valori
-                parts = line.split()
-        
-                # Converti 'D' in 'E' (notazione scientifica Python)
-                values = [float(p.replace('D', 'E')) for p in parts]
+        content = (Path(working_dir) / out_file_name).read_bytes()
+
+        # Se è richiesto solo il 'csv' i valori non servono.
+        if CHART_OUTPUTS.intersection(requested_outputs):
+            table = self._load_duct_table(content)
 
-                # Aggiungi i valori alle colonne
-                x_vals.append(values[0])
-                not_used.append(values[1])
-                gas_volume_fraction.append(values[2])
-                gas_velocity.append(values[3])
-                liquid_velocity.append(values[4])
-                pressure.append(values[5])
+            def column(index):
+                return table[:, index]
+
+            x_vals = column(0)
 
         # In funzione di quanto presente nel parametro outputs
         # predispongo gli elementi di output
@@ -821,7 +1099,7 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
         produced_outputs = {}
         if 'grafico_1' in requested_outputs:
             produced_outputs['grafico_1'] = {
-                'value': {
+                'value': self.chart_value({
                     'chartType': 'line',
                     'domain': {
                         'key': 'Conduit length',
@@ -834,16 +1112,16 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
                             'key': 'Gas volume fraction',
                             'label': 'Gas volume fraction',
                             'unit': '',
-                            'values': gas_volume_fraction
+                            'values': column(2)
                         }
                     ]
-                },
+                }, outputs, 'grafico_1'),
                 'mediaType': 'application/json'
             }
 
         if 'grafico_2' in requested_outputs:
             produced_outputs['grafico_2'] = {
-                'value': {
+                'value': self.chart_value({
                     'chartType': 'line',
                     'domain': {
                         'key': 'Conduit length',
@@ -856,22 +1134,22 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
                             'key': 'Gas velocity',
                             'label': 'Gas velocity',
                             'unit': 'm/s',
-                            'values': gas_velocity
+                            'values': column(3)
                         },
                         {
                             'key': 'Liquid velocity',
                             'label': 'Liquid velocity',
                             'unit': 'm/s',
-                            'values': liquid_velocity
+                            'values': column(4)
                         },
                     ]
-                },
+                }, outputs, 'grafico_2'),
                 'mediaType': 'application/json'
             }
 
         if 'grafico_3' in requested_outputs:
             produced_outputs['grafico_3'] = {
-                'value': {
+                'value': self.chart_value({
                     'chartType': 'line',
                     'domain': {
                         'key': 'Conduit length',
@@ -884,23 +1162,20 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
                             'key': 'Pressure',
                             'label': 'Pressure',
                             'unit': 'Mpa',
-                            'values': pressure
+                            'values': column(5)
                         },
                     ]
-                },
+                }, outputs, 'grafico_3'),
                 'mediaType': 'application/json'
             }
         
         if 'csv' in requested_outputs:
-            with open(str(Path(working_dir) / out_file_name), mode='r') as f:
-                contenuto = f.read()
-
             produced_outputs['csv'] = {
-                'value': contenuto,
+                'value': content.decode('utf-8'),
                 'mediaType': 'text/csv'
             }
 
-        return mimetype, produced_outputs
+        return self.json_result(produced_outputs)
 
     def prepare_input(self, data, working_dir, outputs):
         if bool(outputs):
@@ -908,6 +1183,11 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
             if requested_output - set(self.metadata['outputs']):
                 err_msg = 'Outputs contains unexpected parameters.'
                 raise ProcessorExecuteError(err_msg)
+            if requested_output & SWEEP_OUTPUTS:
+                err_msg = 'Outputs of a sweep require the \'sweep\' input.'
+                raise ProcessorExecuteError(err_msg)
+        for output_id in CHART_OUTPUTS:
+            self.check_chart_output(outputs, output_id)
 
         try:
             components = data['components']['value']
@@ -915,30 +1195,10 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
             err_msg = 'Input not correctly formatted: ' + str(err) + '\'.'
             raise ProcessorExecuteError(err_msg)
         
-        # verifica che i parametri siano completi e non ce ne siano in eccesso.
-        required_key_set = {'p', 't', 'd', 'l', 'sio2', 'tio2', 'al2o3',
-                            'fe2o3', 'feo', 'mno', 'mgo', 'cao', 'na2o', 'k2o',
-                            'h2o', 'co2', 'b'}
-        optional_key_set = {'c', 'den'}
-        default_key_set = {'f'}
-
-        keys_present = set(components)
-        if not required_key_set.issubset(keys_present):
-            err_msg = 'Input does not contains all required parameters.'
-            raise ProcessorExecuteError(err_msg)
-        
-        if optional_key_set.intersection(keys_present):  # Se almeno una opzionale è presente
-            if not optional_key_set.issubset(keys_present):
-                err_msg = 'Input does not contains all required parameters.'
-                raise ProcessorExecuteError(err_msg)
-            
-        extra_keys = keys_present - required_key_set - optional_key_set - default_key_set
-        if extra_keys:
-            err_msg = f"Input contains unexpected parameters: {', '.join(extra_keys)}."
-            raise ProcessorExecuteError(err_msg)
-
         # Create the dictionary with the properties to be passed to the 'code'
         # where property_name=parameter_name, property_value=parameter_value
+        # Parametri completi e intervalli dei valori sono verificati dallo
+        # schema dell'input 'components'.
         # ###############################################
         code_input_param = {}
         for name in components:
@@ -947,16 +1207,6 @@ class ConduitProcessor(BaseRemoteExecutionProcessor):
             if not isinstance(param_value, float):
                 raise ProcessorExecuteError(f"Value 'components[{name}]' must be in decimal or scientific notation.")
 
-            if name in ('f', 'p', 't', 'd', 'l', 'b', 'den'):
-                if param_value <= 0.0:
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be > 0.0.")
-            elif name in ('sio2', 'tio2', 'al2o3', 'fe2o3', 'feo', 'mno', 'mgo', 'cao', 'nao2', 'k2o', 'h20', 'co2'):
-                if not (0.0 < param_value < 1.0):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >0.0 and <1.0.")
-            elif name == 'c':
-                if not (0.0 < param_value < 0.7):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >0.0 and <0.7.")
-
             input_flag = '-' + name
             code_input_param[input_flag] = param_value
         
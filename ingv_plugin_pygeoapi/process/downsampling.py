@@ -0,0 +1,177 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from typing import Optional
+
+import numpy as np
+
+from pygeoapi.process.base import ProcessorExecuteError
+
+# Parametro della definizione di un output 'chartType: line' con il numero
+# massimo di punti da restituire
+MAX_POINTS_PARAM = 'max_points'
+
+# Minimo numero di punti di una serie ridotta: il primo, l'ultimo e
+# almeno un punto intermedio
+MIN_POINTS = 3
+
+
+def requested_max_points(outputs, output_id: str,
+                         default: Optional[int] = None) -> Optional[int]:
+    """
+    Get the max number of points requested for a chart output
+
+    The value is read from the output definition of the request, e.g.
+    `"outputs": {"grafico_1": {"max_points": 1000}}`; `0` requests the
+    full resolution series.
+
+    :param outputs: `outputs` parameter of `execute()`
+    :param output_id: id of the output
+    :param default: value used if not requested
+
+    :returns: max number of points, `None` for no limit
+    """
+    max_points = default
+    if isinstance(outputs, dict) and isinstance(outputs.get(output_id), dict):
+        max_points = outputs[output_id].get(MAX_POINTS_PARAM, default)
+    if max_points is None:
+        return None
+    if (isinstance(max_points, bool) or not isinstance(max_points, int)
+            or max_points < 0 or 0 < max_points < MIN_POINTS):
+        raise ProcessorExecuteError(
+            f"Value '{MAX_POINTS_PARAM}' of output '{output_id}' must be "
+            f"0 or an integer >= {MIN_POINTS}.")
+    return max_points or None
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the points of a series with the Largest-Triangle-Three-Buckets
+    algorithm
+
+    The first and the last points are always kept; the other points are
+    split in `n_out - 2` buckets, and from each bucket the point forming
+    the largest triangle with the previous selected point and the average
+    of the next bucket is kept. Peaks and shape of the series are
+    preserved.
+
+    :param x: domain values, sorted
+    :param y: series values
+    :param n_out: number of points to keep
+
+    :returns: sorted indices of the kept points
+    """
+    n = len(x)
+    if n_out >= n or n_out < MIN_POINTS:
+        return np.arange(n)
+
+    # limiti dei bucket intermedi, da 1 a n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket == n_out - 3:
+            next_x, next_y = x[n - 1], y[n - 1]
+        else:
+            next_end = edges[bucket + 2]
+            next_x = x[end:next_end].mean()
+            next_y = y[end:next_end].mean()
+        prev_x, prev_y = x[selected], y[selected]
+        areas = np.abs((prev_x - next_x) * (y[start:end] - prev_y)
+                       - (prev_x - x[start:end]) * (next_y - prev_y))
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def downsample_chart(chart: dict, max_points: Optional[int]) -> dict:
+    """
+    Reduce the points of a 'chartType: line' output value
+
+    Each series is reduced with `lttb_indices()` to its share of
+    `max_points`; the union of the selected points of all the series is
+    kept, so that the series still share the same domain values. If the
+    union has more than `max_points` points (many series), it is reduced
+    again with `lttb_indices()` on the envelope of the series.
+
+    :param chart: the chart, with 'domain' and 'series' values given
+        as sequences or numpy arrays
+    :param max_points: max number of points, `None` for no reduction
+
+    :returns: the chart with the values as numpy arrays, encoded by
+        the JSON serializer of the processor
+    """
+    domain = np.asarray(chart['domain']['values'], dtype=np.float64)
+    series_values = [np.asarray(s['values'], dtype=np.float64)
+                     for s in chart['series']]
+
+    indices = None
+    if max_points is not None and len(domain) > max_points:
+        budget = max(MIN_POINTS, max_points // max(1, len(series_values)))
+        full_series = [values for values in series_values
+                       if len(values) == len(domain)]
+        selected = [lttb_indices(domain, values, budget)
+                    for values in full_series]
+        if selected:
+            indices = np.unique(np.concatenate(selected))
+        if indices is not None and len(indices) > max_points:
+            envelope = _envelope([values[indices] for values in full_series])
+            indices = indices[lttb_indices(domain[indices], envelope,
+                                           max_points)]
+
+    def reduced(values: np.ndarray) -> np.ndarray:
+        if indices is not None and len(values) == len(domain):
+            return values[indices]
+        return values
+
+    return {
+        **chart,
+        'domain': {**chart['domain'], 'values': reduced(domain)},
+        'series': [{**s, 'values': reduced(values)}
+                   for s, values in zip(chart['series'], series_values)]
+    }
+
+
+def _envelope(series_values: list) -> np.ndarray:
+    # Massimo punto per punto delle serie normalizzate in [0, 1]: i picchi
+    # di ogni serie restano picchi dell'inviluppo, qualunque sia la scala.
+    envelope = np.zeros(len(series_values[0]))
+    for values in series_values:
+        finite = values[np.isfinite(values)]
+        if not len(finite):
+            continue
+        low, high = finite.min(), finite.max()
+        scaled = (values - low) / (high - low) if high > low else values * 0
+        envelope = np.fmax(envelope, np.nan_to_num(scaled, nan=0,
+                                                   posinf=1, neginf=0))
+    return envelope
@@ -0,0 +1,99 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LOGGER = logging.getLogger(__name__)
+
+# pygeoapi crea una nuova istanza del processor per ogni richiesta:
+# le sessioni (e quindi i pool di connessioni) devono essere a livello di
+# modulo per essere riutilizzate tra richieste e thread del manager.
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_executor_session(url_executor: str, pool_maxsize: int = 10,
+                         max_retries: int = 3, backoff_factor: float = 0.5,
+                         pool_block: bool = False) -> requests.Session:
+    """
+    Return the HTTP session shared by every processor calling `url_executor`
+
+    The session keeps alive up to `pool_maxsize` connections to the
+    executor, so that '/execute' and '/job_info' calls reuse the same TCP
+    (and TLS) connections instead of opening a new one per request.
+    The underlying urllib3 pool is thread safe: the same session is used
+    concurrently by all the worker threads of the pygeoapi manager.
+
+    Only connection errors are retried for POST (the request never reached
+    the executor); GET requests are also retried on read errors and on
+    502/503/504 responses.
+
+    :param url_executor: base URL of the executor
+    :param pool_maxsize: max number of connections kept alive
+    :param max_retries: max number of retries of a single request
+    :param backoff_factor: backoff factor between retries (seconds)
+    :param pool_block: if True, wait for a free connection when the pool
+                       is exhausted instead of opening a new one
+
+    :returns: `requests.Session`
+    """
+    key = (url_executor, pool_maxsize, max_retries, backoff_factor,
+           pool_block)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            LOGGER.debug(
+                f'New HTTP session for executor {url_executor} '
+                f'(pool_maxsize={pool_maxsize}, max_retries={max_retries})'
+            )
+            retry = Retry(
+                total=max_retries,
+                connect=max_retries,
+                read=max_retries,
+                status=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET']),
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(
+                pool_maxsize=pool_maxsize,
+                max_retries=retry,
+                pool_block=pool_block
+            )
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _SESSIONS[key] = session
+    return session
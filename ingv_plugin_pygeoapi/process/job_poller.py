@@ -0,0 +1,238 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+import logging
+import threading
+import time
+
+from urllib.parse import urljoin
+
+import requests
+
+from pygeoapi.process.base import ProcessorExecuteError
+
+from ingv_plugin_pygeoapi.process.callback import JobWaiter
+
+LOGGER = logging.getLogger(__name__)
+
+
+class JobStatusPoller:
+    """
+    Background thread polling, on a single schedule, the status of all the
+    outstanding jobs of an executor.
+
+    The status of the jobs is asked in batches with
+    'GET /job_info?ids=<id1>,<id2>,...'; if the executor does not support
+    it, the poller falls back to one 'GET /job_info/<job_id>' per job.
+
+    After `max_failures` consecutive failed rounds (e.g. executor down)
+    all the waiting jobs are failed: their threads are not left waiting
+    forever.
+    """
+
+    # Numero massimo di job per richiesta (lunghezza dell'URL)
+    BATCH_SIZE = 100
+
+    # Timeout (secondi) delle richieste: una connessione bloccata non deve
+    # fermare il poller, e quindi tutti i job dell'executor; il timeout
+    # di lettura è almeno 10 volte polling_time.
+    CONNECT_TIMEOUT = 30
+    READ_TIMEOUT = 30
+
+    def __init__(self, session: requests.Session, url_executor: str,
+                 polling_time: float, max_failures: int = 5):
+        """
+        Initialize object
+
+        :param session: HTTP session towards the executor
+        :param url_executor: base URL of the executor
+        :param polling_time: seconds between two polling rounds
+        :param max_failures: consecutive failed rounds after which the
+                             waiting jobs are failed
+        """
+        self.session = session
+        self.url_executor = url_executor
+        self.polling_time = polling_time
+        self.timeout = (self.CONNECT_TIMEOUT,
+                        max(self.READ_TIMEOUT, 10 * polling_time))
+        self.max_failures = max(1, max_failures)
+        self.failures = 0
+        # None: non ancora verificato se l'executor supporta le richieste
+        # cumulative
+        self.batch_supported = None
+
+        self._waiters = {}
+        self._lock = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name=f'job-poller-{url_executor}', daemon=True)
+        self._thread.start()
+
+    def subscribe(self, job_id: str) -> JobWaiter:
+        """
+        Add the job to the ones polled
+
+        :param job_id: job identifier
+
+        :returns: `JobWaiter` notified on job completion
+        """
+        waiter = JobWaiter(job_id)
+        with self._lock:
+            self._waiters[job_id] = waiter
+            self._lock.notify()
+        return waiter
+
+    def unsubscribe(self, job_id: str) -> None:
+        with self._lock:
+            self._waiters.pop(job_id, None)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._waiters:
+                    self._lock.wait()
+            time.sleep(self.polling_time)
+
+            with self._lock:
+                waiters = dict(self._waiters)
+            try:
+                self._poll(waiters)
+            except Exception as err:
+                # Il thread non deve terminare: si riprova al giro
+                # successivo, fino a max_failures giri falliti di seguito
+                self.failures += 1
+                LOGGER.error(f'Polling of {self.url_executor} failed '
+                             f'({self.failures}/{self.max_failures}): {err}')
+                if self.failures >= self.max_failures:
+                    self._fail_all(ProcessorExecuteError(
+                        f'Polling of the executor failed '
+                        f'{self.failures} times: {err}'))
+            else:
+                self.failures = 0
+
+    def _poll(self, waiters: dict) -> None:
+        pending = set(waiters)
+        if self.batch_supported is not False:
+            job_ids = sorted(pending)
+            for i in range(0, len(job_ids), self.BATCH_SIZE):
+                infos = self._get_batch(job_ids[i:i + self.BATCH_SIZE])
+                if infos is None:
+                    break
+                for info in infos:
+                    job_id = info.get('job_id')
+                    if job_id in pending:
+                        pending.discard(job_id)
+                        self._notify(waiters[job_id], info)
+
+        # Job non restituiti dalla richiesta cumulativa, o executor che
+        # non la supporta: una richiesta per job.
+        for job_id in pending:
+            response = self.session.get(
+                urljoin(self.url_executor, 'job_info/' + job_id),
+                timeout=self.timeout)
+            if not response.ok:
+                try:
+                    message = response.json()['Message']
+                except Exception:
+                    message = str(response)
+                self._finish(waiters[job_id], error=ProcessorExecuteError(
+                    message))
+                continue
+            self._notify(waiters[job_id], response.json())
+
+    def _get_batch(self, job_ids: list):
+        response = self.session.get(
+            urljoin(self.url_executor, 'job_info'),
+            params={'ids': ','.join(job_ids)},
+            timeout=self.timeout)
+        if not response.ok:
+            if self.batch_supported is None:
+                LOGGER.debug(f'{self.url_executor} does not support '
+                             f'job_info?ids=...: polling job by job')
+                self.batch_supported = False
+            return None
+        try:
+            infos = response.json()['jobs']
+        except (ValueError, KeyError, TypeError):
+            self.batch_supported = False
+            return None
+        self.batch_supported = True
+        return infos
+
+    def _fail_all(self, error: Exception) -> None:
+        with self._lock:
+            waiters = list(self._waiters.values())
+        for waiter in waiters:
+            self._finish(waiter, error=error)
+        self.failures = 0
+
+    def _notify(self, waiter: JobWaiter, info: dict) -> None:
+        if info['job_info']['end_processing']:
+            self._finish(waiter, info=info)
+
+    def _finish(self, waiter: JobWaiter, info: dict = None,
+                error: Exception = None) -> None:
+        with self._lock:
+            self._waiters.pop(waiter.job_id, None)
+        if error is None:
+            waiter.deliver(info)
+        else:
+            waiter.fail(error)
+
+
+_POLLERS = {}
+_POLLERS_LOCK = threading.Lock()
+
+
+def get_job_status_poller(session: requests.Session, url_executor: str,
+                          polling_time: float,
+                          max_failures: int = 5) -> JobStatusPoller:
+    """
+    Return the poller of `url_executor` with the given settings, shared by
+    the whole process
+
+    Processors using the same executor with different `polling_time` (or
+    `max_failures`) have distinct pollers.
+
+    :param session: HTTP session towards the executor
+    :param url_executor: base URL of the executor
+    :param polling_time: seconds between two polling rounds
+    :param max_failures: consecutive failed rounds after which the
+                         waiting jobs are failed
+
+    :returns: `JobStatusPoller`
+    """
+    key = (url_executor, polling_time, max_failures)
+    with _POLLERS_LOCK:
+        poller = _POLLERS.get(key)
+        if poller is None:
+            poller = JobStatusPoller(session, url_executor, polling_time,
+                                     max_failures)
+            _POLLERS[key] = poller
+    return poller
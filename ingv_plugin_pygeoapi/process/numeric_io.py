@@ -0,0 +1,222 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import io
+import os
+import tempfile
+
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+# Esponenti in notazione Fortran (1.0D+02) convertiti in notazione Python
+_FORTRAN_EXPONENT = bytes.maketrans(b'Dd', b'Ee')
+
+
+def load_fortran_table(data: bytes, min_columns: int = 1) -> np.ndarray:
+    """
+    Parse a whitespace separated numeric table written by a Fortran 'code'
+
+    The exponents in Fortran notation ('D') are converted in one pass over
+    the whole buffer, then the table is parsed in bulk into a 2D array.
+    Columns after the expected ones (e.g. added by a newer version of the
+    'code') are kept, and ignored by who reads the table by index.
+
+    :param data: content of the file
+    :param min_columns: min number of columns expected
+
+    :returns: array of shape (rows, columns); columns are obtained
+        with `table[:, i]`
+    """
+    if not data.strip():
+        return np.empty((0, min_columns), dtype=np.float64)
+    table = np.loadtxt(io.BytesIO(data.translate(_FORTRAN_EXPONENT)),
+                       dtype=np.float64, ndmin=2)
+    if table.shape[1] < min_columns:
+        raise ValueError(
+            f'Expected at least {min_columns} columns, '
+            f'found {table.shape[1]}.')
+    return table
+
+
+def iter_table_lines(data, offset: int = 0, limit: Optional[int] = None
+                     ) -> Iterator[bytes]:
+    """
+    Iterate lazily over the lines of a table written by a 'code'
+
+    The table ends at the first empty line, or at the end of the data.
+    Each line is located in the buffer when it is requested: the content
+    is never split as a whole, and the lines before `offset` are only
+    skipped.
+
+    :param data: content of the file: `bytes`, or a buffer with the same
+        `find()` and slicing (e.g. `FileBody.buffer`)
+    :param offset: number of lines to skip
+    :param limit: max number of lines, `None` for all
+
+    :returns: iterator of the lines, without the newline
+    """
+    size = len(data)
+    position = 0
+    index = 0
+    while position < size and (limit is None or index < offset + limit):
+        end = data.find(b'\n', position)
+        if end < 0:
+            end = size
+        if end == position:
+            return
+        if index >= offset:
+            yield data[position:end]
+        index += 1
+        position = end + 1
+
+
+def table_slice(data, offset: int = 0, limit: Optional[int] = None
+                ) -> bytes:
+    """
+    Content of some lines of a table written by a 'code', as one slice
+
+    The lines are the ones of `iter_table_lines()`: only their ends are
+    located, and the content is copied once, e.g. to be parsed in bulk
+    with `load_fortran_table()`.
+
+    :param data: content of the file (see `iter_table_lines()`)
+    :param offset: number of lines to skip
+    :param limit: max number of lines, `None` for all
+
+    :returns: the lines, each followed by its newline (but the last line
+        of the data, if without it)
+    """
+    size = len(data)
+    position = 0
+    index = 0
+    start = None
+    while position < size and (limit is None or index < offset + limit):
+        if index == offset:
+            start = position
+        end = data.find(b'\n', position)
+        if end < 0:
+            end = size
+        if end == position:
+            break
+        index += 1
+        position = end + 1
+    if start is None:
+        return b''
+    return bytes(data[start:min(position, size)])
+
+
+def _is_numeric_line(line: bytes) -> bool:
+    line = line.strip()
+    return bool(line) and (line[:1].isdigit() or line[:1] == b'-')
+
+
+def load_csv_table(data: bytes, min_columns: int = 1) -> np.ndarray:
+    """
+    Parse a comma separated numeric table, with a variable number of
+    columns
+
+    The header (the leading non numeric lines) is detected once and
+    skipped, then the table is parsed in bulk into a 2D array; other non
+    numeric lines, if any, are skipped as well.
+
+    :param data: content of the file
+    :param min_columns: min number of columns expected
+
+    :returns: array of shape (rows, columns)
+    """
+    lines = data.splitlines()
+    header_lines = 0
+    for line in lines:
+        if _is_numeric_line(line):
+            break
+        header_lines += 1
+    if header_lines == len(lines):
+        return np.empty((0, min_columns), dtype=np.float64)
+
+    try:
+        table = np.loadtxt(io.BytesIO(data), dtype=np.float64,
+                           delimiter=',', skiprows=header_lines, ndmin=2)
+    except ValueError:
+        # righe non numeriche dopo l'intestazione
+        table = np.loadtxt(
+            [line for line in lines[header_lines:]
+             if _is_numeric_line(line)],
+            dtype=np.float64, delimiter=',', ndmin=2)
+    if table.shape[1] < min_columns:
+        raise ValueError(
+            f'Expected at least {min_columns} columns, '
+            f'found {table.shape[1]}.')
+    return table
+
+
+def format_table(rows: Iterable[Sequence]) -> str:
+    """
+    Format a table for a Fortran 'code' reading it list-directed
+
+    Each value is followed by a tab and each row by a newline; the whole
+    text is built in memory, to be written at once.
+
+    :param rows: the rows of values, converted with `str()`
+
+    :returns: text of the table
+    """
+    return ''.join(['\t'.join(map(str, row)) + '\t\n' for row in rows])
+
+
+def write_atomic(path: Path, content: Union[str, bytes]) -> None:
+    """
+    Write an input file of a 'code' with a single write, atomically
+
+    The content is written to a temporary file with a unique name in the
+    same directory, flushed to the storage (`fsync`), then renamed: the
+    executor, possibly reading the directory through a shared file
+    system, never sees a partial file, and concurrent writers do not
+    collide. An existing file is replaced.
+
+    :param path: the file
+    :param content: the whole content of the file
+    """
+    path = Path(path)
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, mode='wb') as tmp_file:
+            # mkstemp crea il file con permessi 0600: l'executor può
+            # girare con un altro utente
+            os.fchmod(tmp_file.fileno(), 0o644)
+            tmp_file.write(content)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,221 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import importlib
+import logging
+import math
+import threading
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from pygeoapi.process.base import ProcessorGenericError
+
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_timestamp(value) -> Optional[datetime]:
+    """
+    Parse a timestamp returned by the executor in 'job_info'
+
+    :param value: ISO 8601 string (e.g. '2026-01-20T10:00:00Z') or `None`
+
+    :returns: timezone aware `datetime` or `None`
+    """
+    if not value:
+        return None
+    try:
+        timestamp = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+class PollingStrategy:
+    """Generic strategy deciding how long to wait between 'job_info' calls"""
+    def __init__(self, processor_def: dict, process_id: str):
+        """
+        Initialize object
+
+        :param processor_def: processor definition
+        :param process_id: id of the process (from PROCESS_METADATA)
+        """
+        self.process_id = process_id
+
+    def next_delay(self, attempt: int, info: Optional[dict]) -> float:
+        """
+        Seconds to wait before the next 'job_info' call
+
+        :param attempt: number of 'job_info' calls already done
+        :param info: last 'job_info' response, `None` before the first call
+
+        :returns: delay in seconds
+        """
+        raise NotImplementedError()
+
+    def job_completed(self, info: dict) -> None:
+        """
+        Notify the strategy that a job completed
+
+        :param info: final 'job_info' response
+        """
+        pass
+
+
+class FixedPollingStrategy(PollingStrategy):
+    """Constant delay between polls, as defined by `polling_time`"""
+    def __init__(self, processor_def: dict, process_id: str):
+        super().__init__(processor_def, process_id)
+        self.polling_time = float(processor_def.get('polling_time', 3))
+
+    def next_delay(self, attempt: int, info: Optional[dict]) -> float:
+        return self.polling_time
+
+
+class BackoffPollingStrategy(PollingStrategy):
+    """
+    Exponential backoff between polls, from `polling_min_time` up to
+    `polling_max_time`.
+
+    The strategy keeps, for each process, a moving average of the duration
+    of the completed jobs (from 'start_processing' to 'end_processing').
+    Once a job has started, the next poll is scheduled at its predicted
+    end, still within [polling_min_time, polling_max_time].
+    """
+
+    # Durata media (secondi) dei job per process id, condivisa tra
+    # le istanze: pygeoapi crea un processor per ogni richiesta.
+    _durations = {}
+    _durations_lock = threading.Lock()
+
+    # Peso dell'ultima durata nella media mobile esponenziale
+    SMOOTHING = 0.3
+
+    def __init__(self, processor_def: dict, process_id: str):
+        super().__init__(processor_def, process_id)
+        self.min_time = float(processor_def.get('polling_min_time', 0.25))
+        self.max_time = float(processor_def.get('polling_max_time', 30))
+        self.factor = float(processor_def.get('polling_backoff_factor', 1.5))
+        if not (0 < self.min_time <= self.max_time):
+            raise ProcessorGenericError(
+                'Wrong \'polling_min_time\' / \'polling_max_time\' '
+                'in configuration.')
+        if self.factor < 1:
+            raise ProcessorGenericError(
+                'Wrong \'polling_backoff_factor\' in configuration: '
+                'must be >= 1.')
+        # Primo tentativo a cui il backoff raggiunge polling_max_time:
+        # oltre, l'esponente non cresce (factor ** attempt andrebbe in
+        # overflow dopo qualche migliaio di poll).
+        self.max_attempt = 0
+        if self.factor > 1:
+            self.max_attempt = math.ceil(
+                math.log(self.max_time / self.min_time, self.factor))
+
+    def next_delay(self, attempt: int, info: Optional[dict]) -> float:
+        attempt = min(attempt, self.max_attempt)
+        delay = min(self.max_time, self.min_time * self.factor ** attempt)
+
+        # Se il job è in esecuzione e la sua durata è prevedibile,
+        # il prossimo poll è fissato alla fine prevista; a previsione
+        # superata si torna al backoff.
+        remaining = self._predicted_remaining(info)
+        if remaining is not None and remaining > 0:
+            delay = remaining
+
+        return max(self.min_time, min(self.max_time, delay))
+
+    def job_completed(self, info: dict) -> None:
+        job_info = info.get('job_info', {})
+        start = parse_timestamp(job_info.get('start_processing'))
+        end = parse_timestamp(job_info.get('end_processing'))
+        if start is None or end is None or end < start:
+            return
+
+        duration = (end - start).total_seconds()
+        with self._durations_lock:
+            average = self._durations.get(self.process_id)
+            if average is None:
+                average = duration
+            else:
+                average += self.SMOOTHING * (duration - average)
+            self._durations[self.process_id] = average
+
+    def _predicted_remaining(self, info: Optional[dict]) -> Optional[float]:
+        # Nota: il tempo trascorso è calcolato con l'orologio locale
+        # rispetto al timestamp dell'executor; eventuali differenze tra
+        # gli orologi sono contenute dai limiti min/max.
+        if info is None:
+            return None
+        start = parse_timestamp(info['job_info'].get('start_processing'))
+        if start is None:
+            return None
+        with self._durations_lock:
+            average = self._durations.get(self.process_id)
+        if average is None:
+            return None
+
+        elapsed = (datetime.now(timezone.utc) - start).total_seconds()
+        return average - elapsed
+
+
+POLLING_STRATEGIES = {
+    'fixed': FixedPollingStrategy,
+    'backoff': BackoffPollingStrategy,
+}
+
+
+def resolve_polling_strategy(name: str) -> type:
+    """
+    Get the class of the polling strategy defined by `polling_strategy`
+
+    :param name: a key of `POLLING_STRATEGIES` or the dotted path of a
+        `PollingStrategy` subclass
+
+    :returns: the `PollingStrategy` subclass
+    """
+    strategy_class = POLLING_STRATEGIES.get(name)
+    if strategy_class is None:
+        module_name, _, class_name = name.rpartition('.')
+        try:
+            module = importlib.import_module(module_name)
+            strategy_class = getattr(module, class_name)
+        except (ValueError, ImportError, AttributeError):
+            raise ProcessorGenericError(
+                f'Unknown \'polling_strategy\' in configuration: {name}.')
+
+    if not (isinstance(strategy_class, type)
+            and issubclass(strategy_class, PollingStrategy)):
+        raise ProcessorGenericError(
+            f'\'polling_strategy\' {name} is not a PollingStrategy.')
+
+    return strategy_class
+
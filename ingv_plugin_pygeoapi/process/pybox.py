@@ -30,9 +30,8 @@
 import logging
 import re
 import copy
-import base64
-import uuid
 
+from functools import partial
 from pathlib import Path
 
 from pygeoapi.process.base import (
@@ -40,9 +39,18 @@ from pygeoapi.process.base import (
     #    ProcessorGenericError,
 )
 from ingv_plugin_pygeoapi.process.base_remote_execution import BaseRemoteExecutionProcessor
+from ingv_plugin_pygeoapi.process.numeric_io import load_csv_table
+from ingv_plugin_pygeoapi.process.raster import (
+    check_raster_support,
+    convert_to_cog
+)
+from ingv_plugin_pygeoapi.process.streaming import FileBody, MultipartBody
 
 LOGGER = logging.getLogger(__name__)
 
+# Output di tipo 'chartType: line'
+CHART_OUTPUTS = {'spatial_evolution', 'deposit_thickness'}
+
 #: Process metadata and description
 PROCESS_METADATA = {
     # process.yaml -> processSummary.yaml
@@ -439,6 +447,19 @@ class PyboxProcessor(BaseRemoteExecutionProcessor):
         super().__init__(processor_def, PROCESS_METADATA)
         self.supports_outputs = True
 
+        if self.result_store is not None:
+            # i raster possono essere trasmessi per riferimento
+            self.metadata = copy.deepcopy(self.metadata)
+            self.metadata['outputTransmission'] = ['value', 'reference']
+
+        # Raster convertiti in Cloud-Optimized GeoTIFF (tile interni e
+        # overview): il client legge solo i tile visualizzati
+        self.cog_outputs = bool(processor_def.get('cog_outputs', False))
+        self.cog_blocksize = int(processor_def.get('cog_blocksize', 512))
+        self.cog_compression = processor_def.get('cog_compression', 'deflate')
+        if self.cog_outputs:
+            check_raster_support()
+
         self.base_output_filename = "out_file"
 
     def prepare_output(self, info, working_dir, outputs):
@@ -462,251 +483,20 @@ class PyboxProcessor(BaseRemoteExecutionProcessor):
             requested_outputs = outputs
 
         # In funzione di quanto presente nel parametro outputs
-        # predispongo gli elementi di output
-        produced_outputs = {}
-
-        if 'input_data' in requested_outputs:
-            with open(
-                Path(working_dir) / 
-                f"{self.base_output_filename}_params.txt", 
-                mode='r'
-            ) as output_file:
-                contenuto = output_file.read()
-            produced_outputs['input_data'] = {
-                'value': contenuto,
-                'mediaType': 'text/plain'
-            }
-
-        if 'dem' in requested_outputs:
-            with open(
-                Path(working_dir) / 
-                f"{self.base_output_filename}.tif", 
-                mode='rb'
-            ) as output_file:
-                contenuto_bytes = output_file.read()
-            produced_outputs['dem'] = {
-                # ref. spefifiche, pag 63, "imagesOutput"
-                'value': base64.b64encode(contenuto_bytes).decode('utf-8'),
-                'encoding': 'base64',
-                'mediaType': 'application/tiff; application=geotiff'
-            }
-        
-        if 'invasion_map' in requested_outputs:
-            with open(
-                Path(working_dir) / 
-                f"{self.base_output_filename}_EC2.tif", 
-                mode='rb'
-            ) as output_file:
-                contenuto_bytes = output_file.read()
-            produced_outputs['invasion_map'] = {
-                'value': base64.b64encode(contenuto_bytes).decode('utf-8'),
-                'encoding': 'base64',
-                'mediaType': 'application/tiff; application=geotiff'
-            }
-        
-        if 'spatial_evolution' in requested_outputs:
-            x_length = []
-            y_height = []
-            y_rho_c = []
-            y_u = []
-            y_TPE = []
-            y_TKE = []
-            y_hmax = []
-            y_time = []
-            y_eps_n = []    # colonne variabili (eps_0, eps_1, ...)
-
-            with open(
-                Path(working_dir) / 
-                f"{self.base_output_filename}.csv", 
-                mode='r'
-            ) as output_file:
-                for line in output_file:
-                    # Rimuovi spazi
-                    line = line.strip()
-                    # Salta righe vuote
-                    if not line:
-                        continue
-
-                    # Salta intestazioni o righe non numeriche
-                    if not line[0].isdigit() and line[0] != '-':
-                        continue
-
-                    parts = [p.strip() for p in line.split(',')]
-
-                    # Aggiungi i valori alle colonne
-                    values = [float(p) for p in parts]
-                    x_length.append(values[0])
-                    y_height.append(values[1])
-                    y_rho_c.append(values[2])
-                    y_u.append(values[3])
-                    y_TPE.append(values[4])
-                    y_TKE.append(values[5])
-                    y_hmax.append(values[6])
-                    y_time.append(values[7])
-
-                    # --- colonne variabili (dalla 9 in poi) ---
-                    extra_values = values[8:]
-
-                    # inizializza y_eps_n alla prima riga numerica
-                    if not y_eps_n:
-                        y_eps_n = [[] for _ in range(len(extra_values))]
-
-                    # aggiunge ogni valore alla colonna corretta
-                    for i, v in enumerate(extra_values):
-                        y_eps_n[i].append(v)
-
-            # serie fisse:
-            series = [
-                        {
-                            'key': 'height(m)',
-                            'label': 'height(m)',
-                            'unit': 'm',
-                            'description': 'average thickness (height) of the current',
-                            'values': y_height
-                        },
-                        {
-                            'key': 'rho_c(kg/m3)',
-                            'label': 'rho_c(kg/m3)',
-                            'unit': 'kg/m^3',
-                            'description': 'bulk density of the current',
-                            'values': y_rho_c
-                        },
-                        {
-                            'key': 'u(m/s)',
-                            'label': 'u(m/s)',
-                            'unit': 'm/s',
-                            'description': 'front propagation velocity',
-                            'values': y_u
-                        },
-                        {
-                            'key': 'TPE(J)',
-                            'label': 'TPE(J)',
-                            'unit': 'J',
-                            'description': 'total potential energy',
-                            'values': y_TPE
-                        },
-                        {
-                            'key': 'TKE(J)',
-                            'label': 'TKE(J)',
-                            'unit': 'J',
-                            'description': 'total kinetic energy',
-                            'values': y_TKE
-                        },
-                        {
-                            'key': 'hmax(m)',
-                            'label': 'hmax(m)',
-                            'unit': 'm',
-                            'description': 'maximum run-up height (potential to overcome topographic obstacles)',
-                            'values': y_hmax
-                        },
-                        {
-                            'key': 'time(s)',
-                            'label': 'time(s)',
-                            'unit': 's',
-                            'description': 'time from the start of the propagation',
-                            'values': y_time
-                        }
-                    ]
-            # aggiunta dinamica delle serie eps_n
-            for i, eps_values in enumerate(y_eps_n):
-                series.append(
-                    {
-                        'key': f'eps_{i}',
-                        'label': f'eps_{i}',
-                        'unit': '-',
-                        'description': f'volume fraction of particle class {i}',
-                        'values': eps_values
-                    }
-                )
-            produced_outputs['spatial_evolution'] = {
-                'value': {
-                    'chartType': 'line',
-                    'domain': {
-                        'key': 'length(m)',
-                        'label': 'length(m)',
-                        'description': 'distance of the current front from the vent',
-                        'unit': 'm',
-                        'values': x_length
-                    },
-                    'series': series
-                },
-                'mediaType': 'application/json'
-            }
-
-        if 'deposit_thickness' in requested_outputs:
-            x_position = []
-            y_cumulative = []
-            y_thikness_n = []    # colonne variabili (y_thikness_0, y_thikness_1, ...)
- 
-            with open(
-                Path(working_dir) / 
-                f"{self.base_output_filename}_thickness.csv", 
-                mode='r'
-            ) as output_file:
-                for line in output_file:
-                    # Rimuovi spazi
-                    line = line.strip()
-                    # Salta righe vuote
-                    if not line:
-                        continue
-
-                    # Salta intestazioni o righe non numeriche
-                    if not line[0].isdigit() and line[0] != '-':
-                        continue
-
-                    parts = [p.strip() for p in line.split(',')]
-
-                    # Aggiungi i valori alle colonne
-                    values = [float(p) for p in parts]
-                    x_position.append(values[0])
-                    y_cumulative.append(values[1])
-
-                    # --- colonne variabili (dalla 3 in poi) ---
-                    extra_values = values[2:]
-
-                    # inizializza y_thikness_n alla prima riga numerica
-                    if not y_thikness_n:
-                        y_thikness_n = [[] for _ in range(len(extra_values))]
-
-                    # aggiunge ogni valore alla colonna corretta
-                    for i, v in enumerate(extra_values):
-                        y_thikness_n[i].append(v)
-
-            # serie fisse:
-            series = [
-                        {
-                            'key': 'total deposit thickness(m)',
-                            'label': 'total deposit thickness(m)',
-                            'unit': 'm',
-                            'description': 'cumulative thickness of all deposited particle classes',
-                            'values': y_cumulative
-                        }
-                    ]
-            # aggiunta dinamica delle serie eps_n
-            for i, thikness_values in enumerate(y_thikness_n):
-                series.append(
-                    {
-                        'key': f'thickness_{i}',
-                        'label': f'thickness_{i}',
-                        'unit': '-',
-                        'description': f'granulometric class {i} deposit thickness(m)',
-                        'values': thikness_values
-                    }
-                )
-            produced_outputs['deposit_thickness'] = {
-                'value': {
-                    'chartType': 'line',
-                    'domain': {
-                        'key': 'current front position(m)',
-                        'label': 'current front position(m)',
-                        'description': 'front distance from vent at the moment of deposition',
-                        'unit': 'm',
-                        'values': x_position
-                    },
-                    'series': series
-                },
-                'mediaType': 'application/json'
-            }
+        # predispongo gli elementi di output: sono indipendenti tra loro e
+        # vengono preparati in parallelo, restituiti nell'ordine seguente
+        builders = {
+            'input_data': self._input_data_output,
+            'dem': self._dem_output,
+            'invasion_map': self._invasion_map_output,
+            'spatial_evolution': self._spatial_evolution_output,
+            'deposit_thickness': self._deposit_thickness_output
+        }
+        produced_outputs = self.prepare_outputs_concurrently({
+            output_id: partial(builder, working_dir, outputs)
+            for output_id, builder in builders.items()
+            if output_id in requested_outputs
+        })
 
         # --- CASE 1: ONE OUTPUT ONLY ---
         if len(produced_outputs) == 1:
@@ -715,56 +505,242 @@ class PyboxProcessor(BaseRemoteExecutionProcessor):
 
             value = output['value']
 
-            # decode base64 if needed
-            if output.get('encoding') == 'base64':
-                body = base64.b64decode(value)
+            if isinstance(value, (bytes, FileBody)):
+                # raster, streamed from the file if FileBody
+                body = value
+            elif (isinstance(value, (dict, list))
+                  and mimetype == 'application/json'):
+                return self.json_result(value)
             else:
                 # JSON or text
                 if isinstance(value, (dict, list)):
-                    import json
-                    body = json.dumps(value).encode('utf-8')
+                    body = self.json_serializer.dumps(value)
                 else:
                     body = str(value).encode('utf-8')
 
             return mimetype, body
 
         # --- CASE 2: MULTIPLE OUTPUT -> multipart/related ---
-        boundary = f"boundary-{uuid.uuid4()}"
-        parts = []
+        # Le parti sono prodotte durante l'invio: i raster letti a blocchi
+        # dai file, i grafici codificati in JSON a blocchi
+        body = MultipartBody(serializer=self.json_serializer)
 
         for output_id, output in produced_outputs.items():
-            media_type = output['mediaType']
             value = output['value']
 
             # prepare payload
-            if output.get('encoding') == 'base64':
-                payload = base64.b64decode(value)
+            if isinstance(value, (bytes, FileBody)):
+                payload = value
                 transfer_encoding = "binary"
             else:
                 if isinstance(value, (dict, list)):
-                    import json
-                    payload = json.dumps(value).encode('utf-8')
+                    payload = value
                 else:
                     payload = str(value).encode('utf-8')
                 transfer_encoding = "8bit"
 
-            part = (
-                f"--{boundary}\r\n"
-                f"Content-Type: {media_type}\r\n"
-                f"Content-ID: <{output_id}>\r\n"
-                f"Content-Transfer-Encoding: {transfer_encoding}\r\n"
-                f"\r\n"
-            ).encode('utf-8') + payload + b"\r\n"
+            body.add_part(output_id, output['mediaType'], payload,
+                          transfer_encoding)
+
+        if not self.stream_outputs:
+            return body.mimetype, bytes(body)
+        return body.mimetype, body
+
+    def _input_data_output(self, working_dir: str, outputs) -> dict:
+        with open(
+            Path(working_dir) / 
+            f"{self.base_output_filename}_params.txt", 
+            mode='r'
+        ) as output_file:
+            contenuto = output_file.read()
+        return {
+            'value': contenuto,
+            'mediaType': 'text/plain'
+        }
 
-            parts.append(part)
+    def _dem_output(self, working_dir: str, outputs) -> dict:
+        return self._raster_output(
+            Path(working_dir) / f"{self.base_output_filename}.tif",
+            'dem', outputs)
+
+    def _invasion_map_output(self, working_dir: str, outputs) -> dict:
+        return self._raster_output(
+            Path(working_dir) / f"{self.base_output_filename}_EC2.tif",
+            'invasion_map', outputs)
+
+    def _spatial_evolution_output(self, working_dir: str, outputs) -> dict:
+        # colonne: length, height, rho_c, u, TPE, TKE, hmax, time,
+        # poi una colonna eps_n per ogni classe di particelle
+        table = self._load_csv_output(
+            f"{self.base_output_filename}.csv", working_dir, 8)
+        x_length = table[:, 0]
+        y_height = table[:, 1]
+        y_rho_c = table[:, 2]
+        y_u = table[:, 3]
+        y_TPE = table[:, 4]
+        y_TKE = table[:, 5]
+        y_hmax = table[:, 6]
+        y_time = table[:, 7]
+        y_eps_n = table[:, 8:].T    # colonne variabili (eps_0, eps_1, ...)
+
+        # serie fisse:
+        series = [
+                    {
+                        'key': 'height(m)',
+                        'label': 'height(m)',
+                        'unit': 'm',
+                        'description': 'average thickness (height) of the current',
+                        'values': y_height
+                    },
+                    {
+                        'key': 'rho_c(kg/m3)',
+                        'label': 'rho_c(kg/m3)',
+                        'unit': 'kg/m^3',
+                        'description': 'bulk density of the current',
+                        'values': y_rho_c
+                    },
+                    {
+                        'key': 'u(m/s)',
+                        'label': 'u(m/s)',
+                        'unit': 'm/s',
+                        'description': 'front propagation velocity',
+                        'values': y_u
+                    },
+                    {
+                        'key': 'TPE(J)',
+                        'label': 'TPE(J)',
+                        'unit': 'J',
+                        'description': 'total potential energy',
+                        'values': y_TPE
+                    },
+                    {
+                        'key': 'TKE(J)',
+                        'label': 'TKE(J)',
+                        'unit': 'J',
+                        'description': 'total kinetic energy',
+                        'values': y_TKE
+                    },
+                    {
+                        'key': 'hmax(m)',
+                        'label': 'hmax(m)',
+                        'unit': 'm',
+                        'description': 'maximum run-up height (potential to overcome topographic obstacles)',
+                        'values': y_hmax
+                    },
+                    {
+                        'key': 'time(s)',
+                        'label': 'time(s)',
+                        'unit': 's',
+                        'description': 'time from the start of the propagation',
+                        'values': y_time
+                    }
+                ]
+        # aggiunta dinamica delle serie eps_n
+        for i, eps_values in enumerate(y_eps_n):
+            series.append(
+                {
+                    'key': f'eps_{i}',
+                    'label': f'eps_{i}',
+                    'unit': '-',
+                    'description': f'volume fraction of particle class {i}',
+                    'values': eps_values
+                }
+            )
+        return {
+            'value': self.chart_value({
+                'chartType': 'line',
+                'domain': {
+                    'key': 'length(m)',
+                    'label': 'length(m)',
+                    'description': 'distance of the current front from the vent',
+                    'unit': 'm',
+                    'values': x_length
+                },
+                'series': series
+            }, outputs, 'spatial_evolution'),
+            'mediaType': 'application/json'
+        }
 
-        # close multipart
-        parts.append(f"--{boundary}--\r\n".encode('utf-8'))
+    def _deposit_thickness_output(self, working_dir: str, outputs) -> dict:
+        # colonne: position, cumulative, poi una colonna per ogni
+        # classe granulometrica
+        table = self._load_csv_output(
+            f"{self.base_output_filename}_thickness.csv", working_dir, 2)
+        x_position = table[:, 0]
+        y_cumulative = table[:, 1]
+        y_thikness_n = table[:, 2:].T    # colonne variabili (y_thikness_0, y_thikness_1, ...)
+
+        # serie fisse:
+        series = [
+                    {
+                        'key': 'total deposit thickness(m)',
+                        'label': 'total deposit thickness(m)',
+                        'unit': 'm',
+                        'description': 'cumulative thickness of all deposited particle classes',
+                        'values': y_cumulative
+                    }
+                ]
+        # aggiunta dinamica delle serie eps_n
+        for i, thikness_values in enumerate(y_thikness_n):
+            series.append(
+                {
+                    'key': f'thickness_{i}',
+                    'label': f'thickness_{i}',
+                    'unit': '-',
+                    'description': f'granulometric class {i} deposit thickness(m)',
+                    'values': thikness_values
+                }
+            )
+        return {
+            'value': self.chart_value({
+                'chartType': 'line',
+                'domain': {
+                    'key': 'current front position(m)',
+                    'label': 'current front position(m)',
+                    'description': 'front distance from vent at the moment of deposition',
+                    'unit': 'm',
+                    'values': x_position
+                },
+                'series': series
+            }, outputs, 'deposit_thickness'),
+            'mediaType': 'application/json'
+        }
 
-        body = b"".join(parts)
-        mimetype = f'multipart/related; boundary="{boundary}"'
+    def _load_csv_output(self, file_name: str, working_dir: str,
+                         min_columns: int):
+        # Tabella numerica di un file CSV di output, per colonne
+        try:
+            return load_csv_table(
+                (Path(working_dir) / file_name).read_bytes(), min_columns)
+        except ValueError as err:
+            raise ProcessorExecuteError(
+                f"Output file '{file_name}' not correctly formatted: {err}")
+
+    def _raster_output(self, path: Path, output_id: str, outputs) -> dict:
+        # I raster sono restituiti come byte (risposta raw o multipart):
+        # nessuna codifica base64; oppure come link, se richiesti
+        # per riferimento
+        media_type = 'application/tiff; application=geotiff'
+        if self.cog_outputs:
+            convert_to_cog(path, blocksize=self.cog_blocksize,
+                           compression=self.cog_compression)
+        if self.by_reference(outputs, output_id):
+            return {
+                'value': self.publish_output(path, media_type),
+                'mediaType': 'application/json'
+            }
+        return {
+            # ref. spefifiche, pag 63, "imagesOutput"
+            'value': self._file_content(path),
+            'mediaType': media_type
+        }
 
-        return mimetype, body
+    def _file_content(self, path: Path):
+        # Contenuto di un file di output: letto a blocchi dal file al
+        # momento dell'invio se 'stream_outputs', altrimenti in memoria
+        if self.stream_outputs:
+            return FileBody(path)
+        return path.read_bytes()
 
     def prepare_input(self, data, working_dir, outputs):
         if bool(outputs):
@@ -772,58 +748,20 @@ class PyboxProcessor(BaseRemoteExecutionProcessor):
             if requested_output - set(self.metadata['outputs']):
                 err_msg = 'Outputs contains unexpected parameters.'
                 raise ProcessorExecuteError(err_msg)
+        for output_id in CHART_OUTPUTS:
+            self.check_chart_output(outputs, output_id)
+        for output_id in ('dem', 'invasion_map'):
+            self.by_reference(outputs, output_id)
+
+        # Parametri completi, numero delle classi di particelle e
+        # intervalli dei valori sono verificati dagli schemi degli input.
+        particle_classes = data['multiple_values']
+        if not isinstance(particle_classes, list):
+            particle_classes = [particle_classes]
+        valori_eps0 = [classe['eps0'] for classe in particle_classes]
+        valori_rhos = [classe['rhos'] for classe in particle_classes]
+        valori_ds = [classe['ds'] for classe in particle_classes]
 
-        # verifica che i parametri siano completi e non ce ne siano in eccesso.
-        required_key_set = {'lat', 'lon', 'l0', 'h0', 'theta0',
-                            'multiple_values','dt', 'margin'}
-        keys_present = set(data.keys())
-        if not required_key_set.issubset(keys_present):
-            err_msg = 'Input does not contains all required parameters.'
-            raise ProcessorExecuteError(err_msg)
-        
-        extra_keys = keys_present - required_key_set
-        if extra_keys:
-            err_msg = f"Input contains unexpected parameters: {', '.join(extra_keys)}."
-            raise ProcessorExecuteError(err_msg)
-
-        particle_classes = len(data['multiple_values'])
-        if  particle_classes > 21:
-            err_msg = "Input contains too many particle classes: max 21."
-            raise ProcessorExecuteError(err_msg)
-        valori_eps0 = []
-        valori_rhos = []
-        valori_ds = []
-        try:
-            for i, classe in enumerate(data['multiple_values'], 1):
-                # --- controllo tipo e chiavi ---
-                if not isinstance(classe, dict):
-                    raise ProcessorExecuteError(
-                        f"In multiple_values, item number {i} is not an object (dict)."
-                    )
-
-                required_keys = ['eps0', 'rhos', 'ds']
-                missing_keys = [k for k in required_keys if k not in classe]
-                if missing_keys:
-                    raise ProcessorExecuteError(
-                        f"In multiple_values, item number {i} is missing keys: {', '.join(missing_keys)}"
-                    )
-                
-                # Controllo valori
-                if not (0.001 <= classe['eps0'] <= 0.1):
-                    raise ProcessorExecuteError(f"In multiple_values, item numer {i} of eps0: must be >=0.001 and <=0.1.")
-                if not (500 <= classe['rhos'] <= 3500):
-                    raise ProcessorExecuteError(f"In multiple_values, item numer {i} of rhos: must be >=500 and <=3500.")
-                if not (0.00001 <= classe['ds'] <= 0.005):
-                    raise ProcessorExecuteError(f"In multiple_values, item numer {i} of rdshos: must be >=0.00001 and <=0.005.")
-                
-                valori_eps0.append(classe['eps0'])
-                valori_rhos.append(classe['rhos'])
-                valori_ds.append(classe['ds'])
-
-        except KeyError as e:
-            err_msg = f"In multiple_values, the item numer {i} non conteneva la chiave {e}"
-            raise ProcessorExecuteError(err_msg)
-        
         if sum(valori_eps0) >= 1:
             err_msg = f"In multiple_values, the sum of eps0 must be < 1"
             raise ProcessorExecuteError(err_msg)
@@ -843,34 +781,8 @@ class PyboxProcessor(BaseRemoteExecutionProcessor):
         for name in data:
             if name == 'multiple_values':
                 continue
-            # verifica che il formato dei numeri sia corretto
-            param_value = data[name]
-            if name == 'lat':
-                if not (-90.0 <= param_value <= 90):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >=-90.0 and <=90.")
-            if name == 'lon':
-                if not (-180.0 <= param_value <= 180):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >=-180.0 and <=180.")
-            if name == 'l0':
-                if not (100.0 <= param_value <= 2000):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >=100.0 and <=2000.")
-            if name == 'h0':
-                if not (100.0 <= param_value <= 2000):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >=100.0 and <=2000.")
-            if name == 'theta0':
-                if not (300.0 <= param_value <= 1400):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >=300.0 and <=1400.")
-            if name == 'dt':
-                if not (0.1 <= param_value <= 30):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >=0.1 and <=30.")
-            if name == 'margin':
-                if not (5000.0 <= param_value <= 50000):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >=5000.0 and <=50000.")
-            if name == 'theta0':
-                if not (300.0 <= param_value <= 1400):
-                    raise ProcessorExecuteError(f"Value 'components[{name}]' must be >=300.0 and <=1400.")
             input_flag = '--' + name
-            code_input_param[input_flag] = param_value
+            code_input_param[input_flag] = data[name]
 
         # si gestisce il file di output
         code_input_param['-o'] = self.base_output_filename
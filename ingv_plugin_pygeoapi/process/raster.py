@@ -0,0 +1,94 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import logging
+import os
+
+from pathlib import Path
+
+from pygeoapi.process.base import (
+    ProcessorExecuteError,
+    ProcessorGenericError,
+)
+
+try:
+    import rasterio
+    import rasterio.shutil
+    from rasterio.errors import RasterioError
+except ImportError:
+    rasterio = None
+
+LOGGER = logging.getLogger(__name__)
+
+
+def check_raster_support() -> None:
+    """
+    Check that the raster post-processing can be used
+
+    :raises ProcessorGenericError: if `rasterio` is not installed
+    """
+    if rasterio is None:
+        raise ProcessorGenericError(
+            'Cloud-Optimized GeoTIFF outputs require the \'rasterio\' '
+            'package.')
+
+
+def convert_to_cog(path: Path, blocksize: int = 512,
+                   compression: str = 'deflate',
+                   resampling: str = 'nearest') -> None:
+    """
+    Rewrite a GeoTIFF as Cloud-Optimized GeoTIFF
+
+    The file gets internal tiles and overviews, ordered so that a client
+    can read only the tiles of the area (and zoom level) it displays,
+    with HTTP range requests.
+
+    :param path: GeoTIFF file, replaced by the converted one
+    :param blocksize: size (pixels) of the internal tiles
+    :param compression: compression of the tiles
+    :param resampling: resampling method of the overviews
+    """
+    check_raster_support()
+    path = Path(path)
+    tmp_path = path.with_name(f'.{path.stem}.cog{path.suffix}')
+    try:
+        with rasterio.Env(GDAL_NUM_THREADS='ALL_CPUS'):
+            rasterio.shutil.copy(
+                path, tmp_path, driver='COG',
+                BLOCKSIZE=blocksize,
+                COMPRESS=compression.upper(),
+                OVERVIEWS='AUTO',
+                RESAMPLING=resampling.upper())
+    except RasterioError as err:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        LOGGER.error(f'Cannot convert {path} to COG: {err}')
+        raise ProcessorExecuteError(
+            f"Cannot convert '{path.name}' to Cloud-Optimized GeoTIFF.")
+    os.replace(tmp_path, path)
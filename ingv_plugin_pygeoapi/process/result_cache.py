@@ -0,0 +1,293 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+import hashlib
+import io
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from ingv_plugin_pygeoapi.process.streaming import (
+    FileBody,
+    MultipartBody,
+    StreamBody,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = '_result_cache'
+
+# Directory già ripulite dalle versioni precedenti del processo
+_CLEANED_DIRS = set()
+_CLEANED_DIRS_LOCK = threading.Lock()
+
+
+def _canonical_json(value) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(',', ':'),
+                      default=str).encode('utf-8')
+
+
+def _normalized_outputs(outputs):
+    if not outputs:
+        return None
+    if isinstance(outputs, dict):
+        return outputs
+    return sorted(outputs)
+
+
+def job_key(process_id: str, version: str, code_input_params: dict,
+            working_dir: str, outputs: Optional[dict]) -> str:
+    """
+    Compute the key identifying the result of a job
+
+    The key is the hash of the process id and version, of the parameters
+    passed to the 'code', of the requested outputs, and of the input files
+    written by `prepare_input()` in `working_dir`: jobs with the same key
+    produce the same result.
+
+    :returns: hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(_canonical_json({
+        'id': process_id,
+        'version': version,
+        'code_input_params': code_input_params,
+        'outputs': _normalized_outputs(outputs)
+    }))
+    root = Path(working_dir)
+    for path in sorted(p for p in root.rglob('*') if p.is_file()):
+        digest.update(str(path.relative_to(root)).encode('utf-8'))
+        digest.update(b'\0')
+        with open(path, mode='rb') as input_file:
+            while chunk := input_file.read(1 << 20):
+                digest.update(chunk)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class _ResultPickler(pickle.Pickler):
+    # I FileBody non sono copiati in memoria: sono scritti come file
+    # accanto all'entry ('<key>.<n>') e nel pickle resta il loro nome.
+    def __init__(self, file, key: str):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.key = key
+        self.files = []
+
+    def persistent_id(self, obj):
+        if isinstance(obj, FileBody):
+            name = f'{self.key}.{len(self.files)}'
+            self.files.append((name, obj))
+            return name
+        if isinstance(obj, StreamBody) and not isinstance(obj,
+                                                          MultipartBody):
+            raise pickle.PicklingError(
+                f'{type(obj).__name__} is produced while it is sent')
+        return None
+
+
+class _ResultUnpickler(pickle.Unpickler):
+    def __init__(self, file, cache_dir: Path):
+        super().__init__(file)
+        self.cache_dir = cache_dir
+
+    def persistent_load(self, name):
+        return FileBody(self.cache_dir / name)
+
+
+class ResultCache:
+    """
+    On-disk cache of the results of a process, addressed by `job_key()`.
+
+    The cache is kept in `<private_processor_dir>/_result_cache/<version>`:
+    entries of other versions of the process are removed when the cache is
+    first opened, so a new `PROCESS_METADATA['version']` invalidates it.
+    Entries older than `ttl` seconds are discarded, and the least recently
+    used ones are evicted when the cache exceeds `max_size` bytes.
+    """
+    def __init__(self, private_processor_dir: Path, process_id: str,
+                 version: str, ttl: Optional[float] = None,
+                 max_size: Optional[int] = None):
+        """
+        Initialize object
+
+        :param private_processor_dir: private directory of the processor
+        :param process_id: id of the process
+        :param version: version of the process
+        :param ttl: seconds an entry is valid, `None` for no limit
+        :param max_size: max size (bytes) of the cache, `None` for no limit
+        """
+        self.process_id = process_id
+        self.version = version
+        self.ttl = ttl
+        self.max_size = max_size
+
+        base_dir = Path(private_processor_dir) / CACHE_DIR_NAME
+        self.cache_dir = base_dir / version
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        with _CLEANED_DIRS_LOCK:
+            if base_dir not in _CLEANED_DIRS:
+                for old_dir in base_dir.iterdir():
+                    if old_dir.name != version:
+                        LOGGER.debug(f'Removing result cache {old_dir}')
+                        shutil.rmtree(old_dir, ignore_errors=True)
+                _CLEANED_DIRS.add(base_dir)
+
+    def get(self, key: str) -> Optional[Tuple[str, Any]]:
+        """
+        Return the cached result, `None` if missing or expired
+
+        The files of the outputs (`FileBody`) are mapped from the cache
+        directory, not read in memory.
+
+        :param key: cache key
+
+        :returns: tuple (mimetype, outputs) as returned by `prepare_output()`
+        """
+        path = self.cache_dir / key
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if self._expired(mtime, time.time()):
+            self._remove(key)
+            return None
+        try:
+            with open(path, mode='rb') as cache_file:
+                result = _ResultUnpickler(cache_file, self.cache_dir).load()
+            # mtime is the last use, for the LRU eviction
+            os.utime(path)
+        except FileNotFoundError:
+            # entry, or one of its files, evicted meanwhile
+            self._remove(key)
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as err:
+            LOGGER.warning(f'Discarding unreadable cache entry {path}: {err}')
+            self._remove(key)
+            return None
+
+        LOGGER.debug(f'Result cache hit: {self.process_id} {key}')
+        return result
+
+    def put(self, key: str, result: Tuple[str, Any]) -> None:
+        """
+        Store the result of a job
+
+        The files of the outputs (`FileBody`, also as parts of a
+        `MultipartBody`) are written from their memory map to files of
+        the cache, without copying them in memory. Results that cannot be
+        serialized, as the bodies produced while they are sent, are not
+        cached.
+
+        :param key: cache key
+        :param result: tuple (mimetype, outputs)
+        """
+        buffer = io.BytesIO()
+        pickler = _ResultPickler(buffer, key)
+        try:
+            pickler.dump(result)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            LOGGER.debug(f'Result of {self.process_id} not cached: {err}')
+            return
+        data = buffer.getvalue()
+        size = len(data) + sum(body.size for _, body in pickler.files)
+        if self.max_size is not None and size > self.max_size:
+            return
+
+        try:
+            # i file prima dell'entry: chi trova l'entry trova i suoi file
+            for name, body in pickler.files:
+                self._write(name, body.buffer)
+            self._write(key, data)
+        except OSError as err:
+            LOGGER.warning(f'Cannot write cache entry {key}: {err}')
+            self._remove(key)
+            return
+
+        self._evict()
+
+    def _write(self, name: str, content) -> None:
+        # Scrittura atomica: nessun lettore vede un file parziale
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, mode='wb') as cache_file:
+                cache_file.write(content)
+            os.replace(tmp_path, self.cache_dir / name)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _remove(self, key: str) -> None:
+        # l'entry e i suoi file ('<key>.<n>')
+        (self.cache_dir / key).unlink(missing_ok=True)
+        for path in self.cache_dir.glob(f'{key}.*'):
+            path.unlink(missing_ok=True)
+
+    def _expired(self, mtime: float, now: float) -> bool:
+        return self.ttl is not None and now - mtime > self.ttl
+
+    def _evict(self) -> None:
+        # Un'entry e i suoi file sono valutati e rimossi insieme
+        now = time.time()
+        entries = {}
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.startswith('.tmp-'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            key = entry.name.split('.', 1)[0]
+            mtime, size = entries.get(key, (0, 0))
+            entries[key] = (max(mtime, stat.st_mtime), size + stat.st_size)
+
+        for key, (mtime, _) in list(entries.items()):
+            if self._expired(mtime, now):
+                self._remove(key)
+                del entries[key]
+
+        if self.max_size is None:
+            return
+        total_size = sum(size for _, size in entries.values())
+        # least recently used first
+        for key, (_, size) in sorted(entries.items(),
+                                     key=lambda item: item[1]):
+            if total_size <= self.max_size:
+                break
+            self._remove(key)
+            total_size -= size
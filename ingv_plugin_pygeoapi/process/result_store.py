@@ -0,0 +1,129 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urljoin
+
+LOGGER = logging.getLogger(__name__)
+
+# Intervallo minimo (secondi) tra due pulizie della stessa directory
+EVICTION_INTERVAL = 60
+
+# Ultima pulizia di ogni directory dello store, per processo pygeoapi
+_LAST_EVICTION = {}
+_LAST_EVICTION_LOCK = threading.Lock()
+
+
+class ResultStore:
+    """
+    Content addressed store of output files, transmitted by reference
+
+    The files are moved from the job working directory to
+    `<store_dir>/<hh>/<sha256><suffix>` and published at the same relative
+    path under `base_url`: the store must be served by a web server
+    (e.g. nginx, Apache), which also handles the HTTP range requests, so
+    that the files are never loaded by the pygeoapi process.
+    Files not published again for `retention` seconds are removed.
+    """
+    def __init__(self, store_dir: Path, base_url: str,
+                 retention: Optional[float] = None):
+        """
+        Initialize object
+
+        :param store_dir: directory of the store
+        :param base_url: URL the directory is served at
+        :param retention: seconds a file is kept, `None` for no limit
+        """
+        self.store_dir = Path(store_dir)
+        self.base_url = base_url if base_url.endswith('/') else base_url + '/'
+        self.retention = retention
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+    def publish(self, path: Path) -> str:
+        """
+        Move a file into the store
+
+        A file with the same content already in the store is reused,
+        and its retention restarts.
+
+        :param path: file to move, removed from its directory
+
+        :returns: URL of the file
+        """
+        path = Path(path)
+        digest = hashlib.sha256()
+        with open(path, mode='rb') as input_file:
+            while chunk := input_file.read(1 << 20):
+                digest.update(chunk)
+        name = digest.hexdigest()
+        relative_path = Path(name[:2]) / (name + path.suffix)
+        target = self.store_dir / relative_path
+
+        if target.exists():
+            os.utime(target)
+            path.unlink()
+        else:
+            target.parent.mkdir(exist_ok=True)
+            # move in a temporary name, then rename: the web server never
+            # serves a partial file, also if the store is on another
+            # file system
+            tmp_path = target.with_name(f'.{uuid.uuid4().hex}.tmp')
+            shutil.move(path, tmp_path)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, target)
+
+        self._evict()
+        return urljoin(self.base_url, relative_path.as_posix())
+
+    def _evict(self) -> None:
+        if self.retention is None:
+            return
+        now = time.time()
+        with _LAST_EVICTION_LOCK:
+            if now - _LAST_EVICTION.get(self.store_dir, 0) < EVICTION_INTERVAL:
+                return
+            _LAST_EVICTION[self.store_dir] = now
+
+        for path in self.store_dir.glob('*/*'):
+            try:
+                if now - path.stat().st_mtime > self.retention:
+                    LOGGER.debug(f'Removing stored result {path}')
+                    path.unlink()
+            except OSError:
+                # removed concurrently
+                pass
@@ -0,0 +1,324 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import base64
+import json
+import math
+
+from typing import Any, Iterator, Optional
+
+import numpy as np
+
+from pygeoapi.process.base import (
+    ProcessorExecuteError,
+    ProcessorGenericError,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Dimensione dei blocchi di JSON prodotti da `JsonSerializer.iter_chunks()`
+CHUNK_SIZE = 1 << 16
+
+# Parametro della definizione di un output 'chartType: line' con il tipo
+# degli array binari in cui codificare i valori delle serie
+BINARY_VALUES_PARAM = 'binary_values'
+
+# Tipi ammessi, little-endian
+BINARY_DTYPES = {
+    'float32': np.dtype('<f4'),
+    'float64': np.dtype('<f8')
+}
+
+
+def round_significant(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    Round the values to a number of significant digits
+
+    :param values: float array
+    :param digits: number of significant digits
+
+    :returns: the rounded array
+    """
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        magnitude = np.floor(np.log10(np.abs(values)))
+        scale = np.power(10.0, digits - 1 - magnitude)
+        rounded = np.round(values * scale) / scale
+    # zero, inf, nan: unchanged
+    return np.where(np.isfinite(rounded), rounded, values)
+
+
+def _array_to_list(values: np.ndarray) -> list:
+    # NaN e infiniti non sono JSON validi: diventano null, come con orjson
+    if (np.issubdtype(values.dtype, np.floating)
+            and not np.isfinite(values).all()):
+        return np.where(np.isfinite(values), values, None).tolist()
+    return values.tolist()
+
+
+def _finite_floats(value: Any) -> Any:
+    # Come sopra, per i float Python (numpy escluso) di un valore JSON
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite_floats(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_floats(v) for v in value]
+    return value
+
+
+def to_builtin(value: Any) -> Any:
+    """
+    Convert the numpy arrays and scalars in a JSON-like value to lists
+    and Python numbers
+
+    Non finite numbers (NaN, infinities) are converted to `None`, encoded
+    as `null` by every serializer.
+
+    :param value: dict, list or scalar, possibly holding numpy objects
+
+    :returns: the converted value
+    """
+    if isinstance(value, dict):
+        return {k: to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_builtin(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return _array_to_list(value)
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def requested_binary_values(outputs, output_id: str) -> Optional[str]:
+    """
+    Get the binary encoding requested for the values of a chart output
+    (or of another numeric output)
+
+    The value is read from the output definition of the request, e.g.
+    `"outputs": {"grafico_1": {"binary_values": "float32"}}`.
+
+    :param outputs: `outputs` parameter of `execute()`
+    :param output_id: id of the output
+
+    :returns: 'float32', 'float64' or `None` for JSON numbers
+    """
+    if not (isinstance(outputs, dict)
+            and isinstance(outputs.get(output_id), dict)):
+        return None
+    dtype = outputs[output_id].get(BINARY_VALUES_PARAM)
+    if dtype is not None and dtype not in BINARY_DTYPES:
+        raise ProcessorExecuteError(
+            f"Value '{BINARY_VALUES_PARAM}' of output '{output_id}' must be "
+            f"one of: {', '.join(BINARY_DTYPES)}.")
+    return dtype
+
+
+def encode_binary_values(values, dtype: str) -> dict:
+    """
+    Encode numeric values as a base64 little-endian typed array
+
+    A browser decodes it without parsing, e.g.
+    `new Float32Array(Uint8Array.from(atob(data), c => c.charCodeAt(0)).buffer)`.
+
+    :param values: sequence or numpy array of numbers
+    :param dtype: 'float32' or 'float64'
+
+    :returns: object with 'dtype', 'byteOrder', 'encoding', 'length'
+        and 'data'
+    """
+    array = np.ascontiguousarray(values, dtype=BINARY_DTYPES[dtype])
+    return {
+        'dtype': dtype,
+        'byteOrder': 'little',
+        'encoding': 'base64',
+        'length': len(array),
+        'data': base64.b64encode(array.tobytes()).decode('ascii')
+    }
+
+
+def encode_chart_values(chart: dict, dtype: str) -> dict:
+    """
+    Encode the values of domain and series of a 'chartType: line' output
+    value with `encode_binary_values()`
+
+    :param chart: the chart
+    :param dtype: 'float32' or 'float64'
+
+    :returns: the chart, with the same metadata and the encoded values
+    """
+    return {
+        **chart,
+        'domain': {
+            **chart['domain'],
+            'values': encode_binary_values(chart['domain']['values'], dtype)
+        },
+        'series': [
+            {**s, 'values': encode_binary_values(s['values'], dtype)}
+            for s in chart['series']
+        ]
+    }
+
+
+class JsonSerializer:
+    """
+    JSON encoder of the outputs, standard library `json`
+
+    Numpy arrays (e.g. the series of the charts) are encoded as lists;
+    with `float_precision` their values are rounded to that number of
+    significant digits, making the payload smaller. Non finite numbers
+    are encoded as `null`, as `orjson` does.
+    """
+    name = 'json'
+
+    def __init__(self, float_precision: Optional[int] = None):
+        """
+        Initialize object
+
+        :param float_precision: significant digits of the float arrays,
+            `None` for full precision
+        """
+        self.float_precision = float_precision
+
+    @property
+    def native(self) -> bool:
+        """
+        `True` if the encoding is the same as pygeoapi's: outputs can be
+        returned as Python objects, encoded by pygeoapi
+        """
+        return self.float_precision is None
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode the value as JSON
+
+        :returns: UTF-8 encoded JSON
+        """
+        return json.dumps(_finite_floats(value), default=self._default,
+                          allow_nan=False).encode('utf-8')
+
+    def iter_chunks(self, value: Any) -> Iterator[bytes]:
+        """
+        Encode the value as JSON, in chunks
+
+        :returns: iterator of UTF-8 encoded JSON chunks
+        """
+        chunks = []
+        size = 0
+        encoder = json.JSONEncoder(default=self._default, allow_nan=False)
+        for chunk in encoder.iterencode(_finite_floats(value)):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= CHUNK_SIZE:
+                yield ''.join(chunks).encode('utf-8')
+                chunks = []
+                size = 0
+        if chunks:
+            yield ''.join(chunks).encode('utf-8')
+
+    def _array(self, value: np.ndarray) -> np.ndarray:
+        if (self.float_precision is not None
+                and np.issubdtype(value.dtype, np.floating)):
+            return round_significant(value, self.float_precision)
+        return value
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, (np.ndarray, np.generic)):
+            return to_builtin(self._array(np.asarray(value)))
+        raise TypeError(f'{type(value)} is not JSON serializable')
+
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    JSON encoder of the outputs, `orjson` library
+
+    Numpy arrays are encoded natively, without converting them to lists.
+    """
+    name = 'orjson'
+
+    @property
+    def native(self) -> bool:
+        return False
+
+    def dumps(self, value: Any) -> bytes:
+        if self.float_precision is not None:
+            # the contiguous arrays are encoded without calling _default()
+            value = self._rounded(value)
+        return orjson.dumps(value, default=self._default,
+                            option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def iter_chunks(self, value: Any) -> Iterator[bytes]:
+        yield self.dumps(value)
+
+    def _rounded(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {k: self._rounded(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._rounded(v) for v in value]
+        if isinstance(value, np.ndarray):
+            return self._array(value)
+        return value
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, np.ndarray):
+            # e.g. columns of a table, not contiguous
+            return np.ascontiguousarray(self._array(value))
+        return super()._default(value)
+
+
+JSON_SERIALIZERS = {
+    JsonSerializer.name: JsonSerializer,
+    OrjsonSerializer.name: OrjsonSerializer
+}
+
+
+def get_json_serializer(name: str = 'json',
+                        float_precision: Optional[int] = None
+                        ) -> JsonSerializer:
+    """
+    Create the JSON encoder of the outputs
+
+    :param name: 'json' or 'orjson'
+    :param float_precision: significant digits of the float arrays,
+        `None` for full precision
+
+    :returns: the serializer
+    """
+    if name not in JSON_SERIALIZERS:
+        raise ProcessorGenericError(
+            f'Wrong \'json_serializer\' in configuration: {name}.')
+    if name == OrjsonSerializer.name and orjson is None:
+        raise ProcessorGenericError(
+            'The \'orjson\' serializer requires the \'orjson\' package.')
+    return JSON_SERIALIZERS[name](float_precision)
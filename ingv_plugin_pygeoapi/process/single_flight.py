@@ -0,0 +1,83 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import logging
+import threading
+
+from typing import Tuple
+
+from ingv_plugin_pygeoapi.process.callback import JobWaiter
+
+LOGGER = logging.getLogger(__name__)
+
+# Job in esecuzione, per chiave del job (vedi `result_cache.job_key()`),
+# condivisi da tutti i processor del processo pygeoapi.
+_FLIGHTS = {}
+_FLIGHTS_LOCK = threading.Lock()
+
+
+def join_flight(key: str) -> Tuple[JobWaiter, bool]:
+    """
+    Join the execution of the job identified by `key`
+
+    The first caller becomes the leader and must execute the job, then
+    call `land_flight()`; the next callers, until then, receive the same
+    waiter and get the result of the leader with `JobWaiter.wait()`.
+
+    :param key: key of the job
+
+    :returns: the waiter of the job, `True` if the caller is the leader
+    """
+    with _FLIGHTS_LOCK:
+        waiter = _FLIGHTS.get(key)
+        if waiter is not None:
+            LOGGER.debug(f'Joining the running job {waiter.job_id}')
+            return waiter, False
+        waiter = JobWaiter(key)
+        _FLIGHTS[key] = waiter
+        return waiter, True
+
+
+def land_flight(key: str, waiter: JobWaiter, result=None,
+                error: Exception = None) -> None:
+    """
+    Publish the outcome of the job to the callers attached to it
+
+    :param key: key of the job
+    :param waiter: the waiter returned to the leader by `join_flight()`
+    :param result: the result of the job
+    :param error: the exception raised by the job, if failed
+    """
+    with _FLIGHTS_LOCK:
+        if _FLIGHTS.get(key) is waiter:
+            del _FLIGHTS[key]
+    if error is not None:
+        waiter.fail(error)
+    else:
+        waiter.deliver(result)
@@ -27,19 +27,37 @@
 #
 # =================================================================
 
+import asyncio
 import logging
-import re
+import os
+import shutil
 
+from functools import partial
 from pathlib import Path
 
 from pygeoapi.process.base import (
     ProcessorExecuteError,
-    #    ProcessorGenericError,
+    ProcessorGenericError,
 )
 from ingv_plugin_pygeoapi.process.base_remote_execution import BaseRemoteExecutionProcessor
+from ingv_plugin_pygeoapi.process.numeric_io import (
+    format_table,
+    iter_table_lines,
+    load_fortran_table,
+    table_slice,
+    write_atomic,
+)
+from ingv_plugin_pygeoapi.process.serialization import (
+    encode_binary_values,
+    requested_binary_values,
+)
+from ingv_plugin_pygeoapi.process.streaming import FileBody, JsonArrayBody
 
 LOGGER = logging.getLogger(__name__)
 
+# Valori di swinput.data, nell'ordine letto dal 'code'
+SWINPUT_FIELDS = ('ndat1', 'ndat2', 'kl', 'iopen', 'fopen', 'dt', 'tlimit')
+
 #: Process metadata and description
 PROCESS_METADATA = {
     'id': 'solwcad',
@@ -315,76 +333,93 @@ PROCESS_METADATA = {
                         r"[[:digit:]]+))(?:[Dd][+-]?[[:digit:]]+)?$"
                 }
             }
+        },
+        'solwcad.json': {
+            'title': 'Output result, as numeric columns',
+            'description':
+                'An object with one array for each calculated property, '
+                'holding the values of all the records, in the order of '
+                'solwcad.out. With "binary_values" in the output '
+                'definition each array is encoded as a base64 typed array.',
+            'minOccurs': 1,
+            'maxOccurs': 1,
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'Pressure (Mpa)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'Temperature (K)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'H2O (wt%)': {
+                        'description': 'Total ( kl >0) or dissolved ( kl =-1)',
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'CO2 (wt%)': {
+                        'description': 'Total ( kl >0) or dissolved ( kl =-1)',
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'H2O dissolved in the melt (wt%)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'CO2 dissolved in the melt (ppm)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'CO2 in the fluid (wt%)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'CO2 in the fluid (mol%)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'Amount of fluid phase in magma (wt%)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'Amount of fluid phase in magma (vol%)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'Density of the melt phase (kg/m3)': {
+                        'description':
+                            'melt density is computed by the Lange (1994) model',
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'Density of the gas phase (kg/m3)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'Density of the two-phase magma (kg/m3)': {
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'Viscosity of the melt phase [log (Pa s)]': {
+                        'description':
+                            'melt viscosity is computed by '
+                            'the Giordano et al. (2008) model',
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    },
+                    'Viscosity of the two-phase magma [log (Pa s)]': {
+                        'description':
+                            'the viscosity of bubble-bearing melt is computed by '
+                            'the Ishii and Zuber (1979) model for non-deformable '
+                            'bubbles',
+                        'type': 'array',
+                        'items': {'type': 'number'}
+                    }
+                }
+            }
         }
-        #    ,
-        #    'solwcad.json': {
-        #      'description':
-        #        'An array of objects, each containing '
-        #        'the calculated properties.',
-        #      'minOccurs': 1,
-        #      'maxOccurs': 'unbounded',
-        #      'schema': {
-        #        'type': 'object',
-        #        'properties': {
-        #          'Pressure (Mpa)': {
-        #            'type': 'number'
-        #          },
-        #          'Temperature (K)': {
-        #            'type': 'number'
-        #          },
-        #          'H2O (wt%)': {
-        #            'description': 'Total ( kl >0) or dissolved ( kl =-1)',
-        #            'type': 'number'
-        #          },
-        #          'CO2 (wt%)': {
-        #            'description': 'Total ( kl >0) or dissolved ( kl =-1)',
-        #            'type': 'number'
-        #          },
-        #          'H2O dissolved in the melt (wt%)': {
-        #            'type': 'number'
-        #          },
-        #          'CO2 dissolved in the melt (ppm)': {
-        #            'type': 'number'
-        #          },
-        #          'CO2 in the fluid (wt%)': {
-        #            'type': 'number'
-        #          },
-        #          'CO2 in the fluid (mol%)': {
-        #            'type': 'number'
-        #          },
-        #          'Amount of fluid phase in magma (wt%)': {
-        #            'type': 'number'
-        #          },
-        #          'Amount of fluid phase in magma (vol%)': {
-        #            'type': 'number'
-        #          },
-        #          'Density of the melt phase (kg/m3)': {
-        #            'description':
-        #              'melt density is computed by the Lange (1994) model',
-        #            'type': 'number'
-        #          },
-        #          'Density of the gas phase (kg/m3)': {
-        #            'type': 'number'
-        #          },
-        #          'Density of the two-phase magma (kg/m3)': {
-        #            'type': 'number'
-        #          },
-        #          'Viscosity of the melt phase [log (Pa s)]': {
-        #            'description':
-        #              'melt viscosity is computed by '
-        #              'the Giordano et al. (2008) model',
-        #            'type': 'number'
-        #          },
-        #          'Viscosity of the two-phase magma [log (Pa s)]': {
-        #            'description':
-        #              'the viscosity of bubble-bearing melt is computed by '
-        #              'the Ishii and Zuber (1979) model for non-deformable '
-        #              'bubbles',
-        #            'type': 'number'
-        #          }
-        #        }
-        #      }
-        #    }
     },
     'links': [{
         'type': 'text/html',
@@ -430,6 +465,10 @@ PROCESS_METADATA = {
     #
 }
 
+# Colonne del file di output, nell'ordine scritto dal 'code'
+SOLWCAD_COLUMNS = tuple(
+    PROCESS_METADATA['outputs']['solwcad.json']['schema']['properties'])
+
 
 class SolwcadProcessor(BaseRemoteExecutionProcessor):
     """Solwcad Processor example"""
@@ -441,6 +480,294 @@ class SolwcadProcessor(BaseRemoteExecutionProcessor):
         :returns: pygeoapi.process.solwcad.SolwcadProcessor
         """
         super().__init__(processor_def, PROCESS_METADATA)
+        self.supports_outputs = True
+
+        # Suddivisione dei batch (kl = 0, -1) in blocchi di 'chunk_rows'
+        # righe di sw.data, eseguiti come job distinti in parallelo su
+        # 'url_executor' e sugli eventuali 'chunk_url_executors'.
+        # None: il batch è eseguito come un unico job.
+        self.chunk_rows = processor_def.get('chunk_rows')
+        if self.chunk_rows is not None:
+            self.chunk_rows = int(self.chunk_rows)
+            if self.chunk_rows < 1:
+                raise ProcessorGenericError(
+                    'Wrong \'chunk_rows\' in configuration: '
+                    f'{self.chunk_rows}.')
+        self.chunk_url_executors = list(
+            processor_def.get('chunk_url_executors') or [])
+        self.chunk_workers = int(processor_def.get('chunk_workers', 4))
+        self.chunk_retries = int(processor_def.get('chunk_retries', 1))
+
+        # (swinput, righe di sw.data) del batch da suddividere,
+        # impostato da prepare_input()
+        self._batch = None
+        self._executors = None
+
+    def run_remote_job(self, job_id, working_dir, code_input_params):
+        if job_id != self.job_id or self._batch is None:
+            return super().run_remote_job(job_id, working_dir,
+                                          code_input_params)
+
+        chunks = self._chunks()
+        results = self.run_remote_jobs(
+            [(job_id, index, rows) for index, rows in enumerate(chunks)],
+            self.chunk_workers, run=self._run_chunk)
+        return self._merge_chunks(job_id, working_dir, code_input_params,
+                                  results)
+
+    async def run_remote_job_async(self, job_id, working_dir,
+                                   code_input_params):
+        if job_id != self.job_id or self._batch is None:
+            return await super().run_remote_job_async(job_id, working_dir,
+                                                      code_input_params)
+
+        chunks = self._chunks()
+        results = await self.run_remote_jobs_async(
+            [(job_id, index, rows) for index, rows in enumerate(chunks)],
+            self.chunk_workers, run=self._run_chunk_async)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._merge_chunks, job_id, working_dir,
+            code_input_params, results)
+
+    def _chunks(self):
+        _, rows = self._batch
+        return [rows[start:start + self.chunk_rows]
+                for start in range(0, len(rows), self.chunk_rows)]
+
+    def _chunk_executor(self, index, attempt):
+        # I blocchi sono distribuiti a rotazione sugli executor; un nuovo
+        # tentativo usa l'executor successivo.
+        if self._executors is None:
+            self._executors = [self] + [
+                BaseRemoteExecutionProcessor({
+                    **self.processor_def,
+                    'url_executor': url,
+                    'result_cache': False,
+                    'result_store_dir': None
+                }, self.metadata)
+                for url in self.chunk_url_executors
+            ]
+        return self._executors[(index + attempt) % len(self._executors)]
+
+    def _prepare_chunk(self, job_id, index, attempt, rows):
+        # Working dir e file di input di un blocco: le righe sono
+        # rinumerate da 1
+        swinput, _ = self._batch
+        chunk_id = f'{job_id}_{index:04d}_{attempt}'
+        chunk_dir = str(self.private_processor_dir / chunk_id)
+        os.mkdir(chunk_dir, mode=0o755)
+        code_input_params = self._write_input(
+            chunk_dir, {**swinput, 'ndat1': 1, 'ndat2': len(rows)}, rows)
+        return chunk_id, chunk_dir, code_input_params
+
+    def _run_chunk(self, job_id, index, rows):
+        for attempt in range(self.chunk_retries + 1):
+            chunk_id, chunk_dir, code_input_params = self._prepare_chunk(
+                job_id, index, attempt, rows)
+            try:
+                info = self._chunk_executor(index, attempt).run_remote_job(
+                    chunk_id, chunk_dir, code_input_params)
+            except ProcessorExecuteError as err:
+                if attempt == self.chunk_retries:
+                    raise
+                LOGGER.warning(f"The job '{chunk_id}' failed, retrying: {err}")
+                # il tentativo successivo usa una nuova working dir
+                shutil.rmtree(chunk_dir, ignore_errors=True)
+                continue
+            if (info['job_info']['exit_code'] == 0
+                    or attempt == self.chunk_retries):
+                return chunk_dir, info
+            LOGGER.warning(
+                f"The job '{chunk_id}' exited with code "
+                f"{info['job_info']['exit_code']}, retrying.\n"
+                f"Error message:\n{info['job_info']['std_err']}")
+            # l'errore è nel log: la working dir non serve più
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+
+    async def _run_chunk_async(self, job_id, index, rows):
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.chunk_retries + 1):
+            chunk_id, chunk_dir, code_input_params = \
+                await loop.run_in_executor(None, self._prepare_chunk,
+                                           job_id, index, attempt, rows)
+            try:
+                info = await self._chunk_executor(
+                    index, attempt).run_remote_job_async(
+                        chunk_id, chunk_dir, code_input_params)
+            except ProcessorExecuteError as err:
+                if attempt == self.chunk_retries:
+                    raise
+                LOGGER.warning(f"The job '{chunk_id}' failed, retrying: {err}")
+                # il tentativo successivo usa una nuova working dir
+                await loop.run_in_executor(
+                    None, shutil.rmtree, chunk_dir, True)
+                continue
+            if (info['job_info']['exit_code'] == 0
+                    or attempt == self.chunk_retries):
+                return chunk_dir, info
+            LOGGER.warning(
+                f"The job '{chunk_id}' exited with code "
+                f"{info['job_info']['exit_code']}, retrying.\n"
+                f"Error message:\n{info['job_info']['std_err']}")
+            # l'errore è nel log: la working dir non serve più
+            await loop.run_in_executor(None, shutil.rmtree, chunk_dir, True)
+
+    def _merge_chunks(self, job_id, working_dir, code_input_params, results):
+        # Gli output dei blocchi sono concatenati, nell'ordine delle righe,
+        # nel file di output del job: il batch appare come un unico job.
+        failed = [info for _, info in results
+                  if info['job_info']['exit_code'] != 0]
+        for chunk_dir, info in results:
+            if failed and info['job_info']['exit_code'] != 0:
+                # do not remove working_dir for debugging purpose
+                continue
+            if failed:
+                shutil.rmtree(chunk_dir)
+        if failed:
+            return failed[0]
+
+        with open(str(Path(working_dir) / code_input_params['-output']),
+                  mode='x+b') as output_file:
+            for chunk_dir, info in results:
+                with open(str(Path(chunk_dir) / info['params']['-output']),
+                          mode='rb') as chunk_file:
+                    shutil.copyfileobj(chunk_file, output_file)
+
+        for chunk_dir, info in results:
+            # content of chunk_dir no more usefull
+            shutil.rmtree(chunk_dir)
+
+        return {
+            'job_id': job_id,
+            'job_info': {
+                'exit_code': 0,
+                'std_out': ''.join(info['job_info']['std_out'] or ''
+                                   for _, info in results),
+                'std_err': ''.join(info['job_info']['std_err'] or ''
+                                   for _, info in results)
+            },
+            'params': code_input_params
+        }
+
+    def _execute_job(self, data, outputs):
+        # Il job è eseguito (o preso dalla cache) indipendentemente dagli
+        # output e dalle pagine richieste: sono tutti prodotti dallo
+        # stesso file di output.
+        requested_outputs = self._requested_outputs(outputs)
+        mimetype, content = super()._execute_job(data, None)
+        return self._solwcad_outputs(content, requested_outputs, outputs)
+
+    async def _execute_job_async(self, data, outputs):
+        requested_outputs = self._requested_outputs(outputs)
+        mimetype, content = await super()._execute_job_async(data, None)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._solwcad_outputs, content, requested_outputs,
+            outputs)
+
+    def _requested_outputs(self, outputs):
+        # Output richiesti, con la pagina richiesta di ognuno:
+        # {output_id: (offset, limit)}; default solo 'solwcad.out'
+        if not bool(outputs):
+            return {'solwcad.out': (0, None)}
+        requested_output = set(outputs.keys() if isinstance(outputs, dict) else outputs)
+        if requested_output - set(self.metadata['outputs']):
+            err_msg = 'Outputs contains unexpected parameters.'
+            raise ProcessorExecuteError(err_msg)
+        requested_binary_values(outputs, 'solwcad.json')
+        return {output_id: self._output_page(outputs, output_id)
+                for output_id in self.metadata['outputs']
+                if output_id in requested_output}
+
+    @staticmethod
+    def _output_page(outputs, output_id):
+        # Pagina richiesta con 'offset' e 'limit' nella definizione
+        # dell'output: (offset, limit)
+        if not (isinstance(outputs, dict)
+                and isinstance(outputs.get(output_id), dict)):
+            return 0, None
+
+        offset = outputs[output_id].get('offset', 0)
+        limit = outputs[output_id].get('limit')
+        if (not isinstance(offset, int) or isinstance(offset, bool)
+                or offset < 0):
+            raise ProcessorExecuteError(
+                f'Output \'{output_id}\': \'offset\' must be an integer >= 0.')
+        if limit is not None and (not isinstance(limit, int)
+                                  or isinstance(limit, bool) or limit < 1):
+            raise ProcessorExecuteError(
+                f'Output \'{output_id}\': \'limit\' must be an integer >= 1.')
+        return offset, limit
+
+    def _solwcad_outputs(self, content, requested_outputs, outputs):
+        # Output richiesti, dal contenuto del file di output: un solo
+        # output è restituito come tale, più output per id.
+        if isinstance(content, FileBody):
+            content = content.buffer
+
+        if list(requested_outputs) == ['solwcad.out'] and self.stream_outputs:
+            # le righe sono codificate mentre la risposta viene inviata
+            offset, limit = requested_outputs['solwcad.out']
+            output = self._page_members('solwcad.out', content, offset, limit)
+            return ('application/json; charset=utf-8',
+                    JsonArrayBody(output, 'value',
+                                  partial(self._out_rows, content, offset,
+                                          limit),
+                                  self.json_serializer))
+
+        builders = {
+            'solwcad.out': self._solwcad_out,
+            'solwcad.json': self._solwcad_json
+        }
+        produced_outputs = {
+            output_id: builders[output_id](content, offset, limit, outputs)
+            for output_id, (offset, limit) in requested_outputs.items()
+        }
+        if len(produced_outputs) == 1:
+            return self.json_result(next(iter(produced_outputs.values())))
+        return self.json_result(produced_outputs)
+
+    @staticmethod
+    def _page_members(output_id, content, offset, limit):
+        output = {'id': output_id}
+        if offset or limit is not None:
+            output['numberMatched'] = sum(
+                1 for _ in iter_table_lines(content))
+            output['offset'] = offset
+            output['limit'] = limit
+        return output
+
+    @staticmethod
+    def _out_rows(content, offset, limit):
+        # Le righe sono lette dal file solo quando servono
+        # NOTE: there is no check the output is well formatted,
+        # i.e. one line per set of 15 numbers, without empty lines
+        return ({'value': line.decode('utf-8').split()}
+                for line in iter_table_lines(content, offset, limit))
+
+    def _solwcad_out(self, content, offset, limit, outputs):
+        output = self._page_members('solwcad.out', content, offset, limit)
+        output['value'] = list(self._out_rows(content, offset, limit))
+        return output
+
+    def _solwcad_json(self, content, offset, limit, outputs):
+        # Le righe sono convertite in blocco in colonne numeriche
+        # (esponenti Fortran 'D' compresi), restituite come array JSON
+        # o, con 'binary_values', come typed array base64.
+        output = self._page_members('solwcad.json', content, offset, limit)
+        try:
+            table = load_fortran_table(table_slice(content, offset, limit),
+                                       min_columns=len(SOLWCAD_COLUMNS))
+        except ValueError as err:
+            raise ProcessorExecuteError(
+                f'Output file not correctly formatted: {err}')
+
+        dtype = requested_binary_values(outputs, 'solwcad.json')
+        output['value'] = {
+            name: (table[:, index] if dtype is None
+                   else encode_binary_values(table[:, index], dtype))
+            for index, name in enumerate(SOLWCAD_COLUMNS)
+        }
+        return output
 
     def prepare_output(self, info, working_dir, outputs):
         # Only one output:
@@ -451,157 +778,72 @@ class SolwcadProcessor(BaseRemoteExecutionProcessor):
         # but in this case the "product" is a string in URL format,
         # NOT the object/file that can be retrieved at the given URL.
 
-        mimetype = 'application/json'
-
+        # Il risultato del job (conservato nella cache e condiviso con le
+        # richieste identiche) è il contenuto del file di output, mappato
+        # in memoria: gli output ne sono prodotti da _solwcad_outputs().
         code_params = info['params']
-        solwcad_out = []
-        with open(str(Path(working_dir) / code_params['-output']), mode='r+t'
-                  ) as output_file:
-            # NOTE: there is no check the output is well formatted,
-            # i.e. one line per set of 15 numbers, without empty lines
-            while len(line_items := output_file.readline().strip('\n')) > 0:
-                solwcad_out.append({"value": line_items.split()})
-
-        output = {
-            'id': 'solwcad.out',
-            'value': solwcad_out
-        }
-        return mimetype, output
+        return 'text/plain', FileBody(Path(working_dir) / code_params['-output'])
 
     def prepare_input(self, data, working_dir, outputs):
-        pattern_generic_number = \
-            r"^([+-]?([\d]+\.|[\d]*\.[\d]+))([Dd][+-]?[\d]+)?$"
-
+        # Formato e valori di 'swinput.data' e 'sw.data' (tipo di
+        # computazione, interi, numeri in notazione Fortran, 14 valori
+        # per riga) sono verificati dagli schemi degli input: qui si
+        # completano i parametri non usati dalla computazione richiesta.
         try:
-            swinput = data['swinput.data']['value']
-            sw = []
-            for item in data['sw.data']:
-                sw.append(item['value'])
+            swinput = dict(data['swinput.data']['value'])
+            sw_items = data['sw.data']
+            if not isinstance(sw_items, list):
+                sw_items = [sw_items]
+            sw = [item['value'] for item in sw_items]
         except Exception as err:
             err_msg = 'Input not correctly formatted: ' + str(err) + '\'.'
             raise ProcessorExecuteError(err_msg)
 
-        kl = swinput.get('kl', None)
-        if kl is None:
-            err_msg = 'Value \'swinput.data[\'kl\']\' must be provided.'
-            raise ProcessorExecuteError(err_msg)
-
-        ndat1 = swinput.get('ndat1', None)
-        ndat2 = swinput.get('ndat2', None)
-        iopen = swinput.get('iopen', None)
-        fopen = swinput.get('fopen', None)
-        dt = swinput.get('dt', None)
-        tlimit = swinput.get('tlimit', None)
+        kl = swinput['kl']
         match kl:
             case 0 | -1:
-                try:
-                    int(ndat1)
-                    int(ndat2)
-                except (ValueError, TypeError):
-                    err_msg = 'Values \'swinput.data[\'ndat1\']\' and ' \
-                              ' \'swinput.data[\'ndat2\']\' must be integer.'
-                    raise ProcessorExecuteError(err_msg)
                 swinput['iopen'] = 0
                 swinput['fopen'] = swinput['dt'] = swinput['tlimit'] = "0.0"
-            case 1:
-                try:
-                    swinput['iopen'] = iopen = int(iopen)
-                    if ((iopen < 0) or (iopen > 1)):
-                        err_msg = 'Value \'swinput.data[\'iopen\']\' ' \
-                                  'must be [0, 1].'
-                        raise ProcessorExecuteError(err_msg)
-                except (ValueError, TypeError):
-                    err_msg = 'Value \'swinput.data[\'iopen\']\' ' \
-                              'must be integer.'
-                    raise ProcessorExecuteError(err_msg)
-
-                swinput['fopen'] = fopen = str(fopen)
-                if (iopen == 1):
-                    if not re.match(pattern_generic_number, fopen):
+            case 1 | 2:
+                if swinput['iopen'] == 1:
+                    if 'fopen' not in swinput:
                         err_msg = 'Value \'swinput.data[\'fopen\']\' ' \
-                                  'not correctly formatted.'
-                else:
-                    swinput['fopen'] = "0.0"
-
-                swinput['ndat2'] = 0
-                swinput['dt'] = swinput['tlimit'] = "0.0"
-            case 2:
-                try:
-                    swinput['iopen'] = iopen = int(iopen)
-                    if ((iopen < 0) or (iopen > 1)):
-                        err_msg = 'Value \'swinput.data[\'iopen\']\' ' \
-                                  'must be [0, 1].'
+                                  'must be provided with iopen = 1.'
                         raise ProcessorExecuteError(err_msg)
-                except (ValueError, TypeError):
-                    err_msg = 'Value \'swinput.data[\'iopen\']\' ' \
-                              'must be integer.'
-                    raise ProcessorExecuteError(err_msg)
-
-                swinput['fopen'] = fopen = str(fopen)
-                if (iopen == 1):
-                    if not re.match(pattern_generic_number, fopen):
-                        err_msg = 'Value \'swinput.data[\'fopen\']\' ' \
-                                  'not correctly formatted.'
                 else:
                     swinput['fopen'] = "0.0"
 
-                swinput['dt'] = dt = str(dt)
-                if not re.match(pattern_generic_number, dt):
-                    err_msg = 'Value \'swinput.data[\'dt\']\' ' \
-                              'not correctly formatted.'
-
-                swinput['tlimit'] = tlimit = str(tlimit)
-                if not re.match(pattern_generic_number, tlimit):
-                    err_msg = 'Value \'swinput.data[\'tlimit\']\' ' \
-                              'not correctly formatted.'
-
                 swinput['ndat2'] = 0
-            case _:
-                err_msg = 'Value \'swinput.data[\'kl\']\' not accepted.'
-                raise ProcessorExecuteError(err_msg)
-
-        if not isinstance(sw, list | tuple):
-            err_msg = 'Received \'sw.data\' with wrong format: not a sequence.'
-            raise ProcessorExecuteError(err_msg)
-
-        for sw_line in sw:
-            if not isinstance(sw_line, list | tuple):
-                err_msg = 'In \'sw.data\' received an item ' \
-                          'with wrong format: not a sequence.'
-                raise ProcessorExecuteError(err_msg)
-
-            if len(sw_line) != 14:
-                err_msg = 'In \'sw.data\' received an item with ' \
-                          'wrong number of items: ' + str(len(sw_line)) + '.'
-                raise ProcessorExecuteError(err_msg)
-
-            for number in sw_line:
-                if not re.match(pattern_generic_number, str(number)):
-                    err_msg = 'Value in \'sw.data\' ' \
-                              'not correctly formatted: \'' + number + '\'.'
-                    raise ProcessorExecuteError(err_msg)
-
+                if kl == 1:
+                    swinput['dt'] = swinput['tlimit'] = "0.0"
+
+        # Batch da suddividere in blocchi: le righe da ndat1 a ndat2
+        self._batch = None
+        if self.chunk_rows is not None and kl in (0, -1):
+            first, last = int(swinput['ndat1']), int(swinput['ndat2'])
+            if (1 <= first <= last <= len(sw)
+                    and last - first + 1 > self.chunk_rows):
+                self._batch = (swinput, sw[first - 1:last])
+
+        # Il testo di sw.data è già stato prodotto dalla validazione
+        return self._write_input(working_dir, swinput, sw,
+                                 self.input_tables.get('sw.data'))
+
+    @staticmethod
+    def _write_input(working_dir, swinput, sw, sw_text=None):
         # Create input file(s) required to run the 'code'
+        # Ogni file è prodotto in memoria e scritto con una sola write,
+        # in modo atomico: l'executor non vede mai un file parziale.
         # ###############################################
         swinput_filename = "swinput.data"
-        # The file must not exist, otherwise there is a problem!
-        with open(str(Path(working_dir) / swinput_filename),
-                  mode='x+t') as swinput_file:
-            swinput_file.write(str(swinput['ndat1']) + '\t')
-            swinput_file.write(str(swinput['ndat2']) + '\t')
-            swinput_file.write(str(swinput['kl']) + '\t')
-            swinput_file.write(str(swinput['iopen']) + '\t')
-            swinput_file.write(str(swinput['fopen']) + '\t')
-            swinput_file.write(str(swinput['dt']) + '\t')
-            swinput_file.write(str(swinput['tlimit']) + '\n')
+        write_atomic(Path(working_dir) / swinput_filename,
+                     '\t'.join(str(swinput[key]) for key in SWINPUT_FIELDS)
+                     + '\n')
 
         sw_filename = "sw.data"
-        # The file must not exist, otherwise there is a problem!
-        with open(str(Path(working_dir) / sw_filename), mode='x+t') as sw_file:
-            for line in sw:
-                for value in line:
-                    sw_file.write(str(value) + '\t')
-                sw_file.write('\n')
+        if sw_text is None:
+            sw_text = format_table(sw)
+        write_atomic(Path(working_dir) / sw_filename, sw_text)
 
         # Create the dictionary with the properties to be passed to the 'code'
         # where property_name=parameter_name, property_value=parameter_value
@@ -0,0 +1,233 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import mmap
+import os
+import uuid
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from ingv_plugin_pygeoapi.process.serialization import JsonSerializer
+
+# Dimensione dei blocchi inviati nel corpo della risposta
+CHUNK_SIZE = 1 << 20
+
+
+class StreamBody:
+    """
+    Response body produced lazily, in chunks
+
+    A body can be iterated many times (e.g. by the requests joined to the
+    same job), each iteration yields the whole content. The content is
+    also available as `bytes(body)` and through the buffer protocol.
+
+    NOTE: a body is not copied in memory to be pickled: `ResultCache`
+    stores the `FileBody` as files, and does not cache the bodies
+    produced while they are sent.
+
+    NOTE: the server can send a body in chunks only if it is returned to
+    pygeoapi as an iterator (see `open_stream()`) and the job manager has
+    no `output_dir`: otherwise the manager can write only `bytes`.
+    """
+    def __iter__(self) -> Iterator[bytes]:
+        raise NotImplementedError()
+
+    def __bytes__(self) -> bytes:
+        return b''.join(self)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(bytes(self))
+
+
+class FileBody(StreamBody):
+    """
+    Content of a file, read through a memory map
+
+    The file is mapped when the object is created: the content is still
+    available after the file (or the working directory) has been removed.
+    """
+    def __init__(self, path: Path):
+        """
+        Initialize object
+
+        :param path: path of the file
+        """
+        with open(path, mode='rb') as input_file:
+            self.size = os.fstat(input_file.fileno()).st_size
+            self._map = None
+            if self.size:
+                self._map = mmap.mmap(input_file.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        for offset in range(0, self.size, CHUNK_SIZE):
+            yield self._map[offset:offset + CHUNK_SIZE]
+
+    def __bytes__(self) -> bytes:
+        if self._map is None:
+            return b''
+        return self._map[:]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        if self._map is None:
+            return memoryview(b'')
+        return memoryview(self._map)
+
+    @property
+    def buffer(self) -> Any:
+        """
+        Content of the file, with the search and slicing methods of
+        `bytes` (e.g. `find()`), without copying it in memory
+        """
+        if self._map is None:
+            return b''
+        return self._map
+
+
+class JsonArrayBody(StreamBody):
+    """
+    JSON object whose last member is an array produced item by item
+
+    The items are generated and encoded while the body is sent: the whole
+    array is never held in memory.
+    """
+    def __init__(self, members: dict, array_name: str,
+                 items: Callable[[], Iterable[Any]],
+                 serializer: Optional[JsonSerializer] = None):
+        """
+        Initialize object
+
+        :param members: the other members of the object
+        :param array_name: name of the array member
+        :param items: function returning a new iterable over the items of
+            the array, called at each iteration of the body
+        :param serializer: encoder of the members and of the items
+        """
+        self.members = members
+        self.array_name = array_name
+        self.items = items
+        self.serializer = serializer or JsonSerializer()
+
+    def __iter__(self) -> Iterator[bytes]:
+        dumps = self.serializer.dumps
+        head = dumps(self.members)[:-1]
+        if self.members:
+            head += b', '
+        chunks = [head, dumps(self.array_name), b': [']
+        size = 0
+        separator = b''
+        for item in self.items():
+            chunk = dumps(item)
+            chunks.append(separator)
+            chunks.append(chunk)
+            separator = b', '
+            size += len(chunk) + 2
+            if size >= CHUNK_SIZE:
+                yield b''.join(chunks)
+                chunks = []
+                size = 0
+        chunks.append(b']}')
+        yield b''.join(chunks)
+
+
+class MultipartBody(StreamBody):
+    """
+    'multipart/related' body, whose parts are produced while it is sent
+
+    The payload of a part can be `bytes`, a `StreamBody` (e.g. a
+    `FileBody`, sent in chunks from the file) or a value encoded as JSON
+    while it is sent: the whole body is never held in memory.
+    """
+    def __init__(self, boundary: Optional[str] = None,
+                 serializer: Optional[JsonSerializer] = None):
+        """
+        Initialize object
+
+        :param boundary: boundary of the parts, random if `None`
+        :param serializer: encoder of the JSON parts
+        """
+        self.boundary = boundary or f"boundary-{uuid.uuid4()}"
+        self.serializer = serializer or JsonSerializer()
+        self._parts = []
+
+    @property
+    def mimetype(self) -> str:
+        return f'multipart/related; boundary="{self.boundary}"'
+
+    def add_part(self, content_id: str, media_type: str, payload: Any,
+                 transfer_encoding: str = 'binary') -> None:
+        """
+        Append a part to the body
+
+        :param content_id: value of the 'Content-ID' header
+        :param media_type: value of the 'Content-Type' header
+        :param payload: `bytes`, `StreamBody` or value to encode as JSON
+        :param transfer_encoding: value of the 'Content-Transfer-Encoding'
+            header
+        """
+        header = (
+            f"--{self.boundary}\r\n"
+            f"Content-Type: {media_type}\r\n"
+            f"Content-ID: <{content_id}>\r\n"
+            f"Content-Transfer-Encoding: {transfer_encoding}\r\n"
+            f"\r\n"
+        ).encode('utf-8')
+        self._parts.append((header, payload))
+
+    def __iter__(self) -> Iterator[bytes]:
+        for header, payload in self._parts:
+            yield header
+            if isinstance(payload, bytes):
+                yield payload
+            elif isinstance(payload, StreamBody):
+                yield from payload
+            else:
+                yield from self.serializer.iter_chunks(payload)
+            yield b"\r\n"
+        yield self._closing()
+
+    def _closing(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode('utf-8')
+
+
+def open_stream(outputs: Any) -> Any:
+    """
+    Return the outputs of `execute()` in a form the server can stream
+
+    :param outputs: outputs produced by the processor
+
+    :returns: an iterator over a `StreamBody`, the outputs otherwise
+    """
+    if isinstance(outputs, StreamBody):
+        return iter(outputs)
+    return outputs
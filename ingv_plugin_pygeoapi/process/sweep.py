@@ -0,0 +1,125 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+import itertools
+from typing import List, Tuple
+
+import numpy as np
+
+from pygeoapi.process.base import ProcessorExecuteError
+
+
+def sweep_length(name: str, spec) -> int:
+    """
+    Check the values of a swept parameter and get their number, without
+    building them
+
+    :param name: name of the parameter
+    :param spec: list or range of values (see `sweep_values()`)
+
+    :returns: the number of values of the parameter
+    """
+    if isinstance(spec, dict):
+        if set(spec) != {'start', 'stop', 'num'}:
+            raise ProcessorExecuteError(
+                f"Value 'sweep[{name}]' must define 'start', 'stop' "
+                f"and 'num'.")
+        num = spec['num']
+        if isinstance(num, bool) or not isinstance(num, int) or num < 1:
+            raise ProcessorExecuteError(
+                f"Value 'sweep[{name}][num]' must be an integer >= 1.")
+        bounds = (spec['start'], spec['stop'])
+        if any(isinstance(v, bool) or not isinstance(v, (int, float))
+               for v in bounds):
+            raise ProcessorExecuteError(
+                f"Values 'sweep[{name}][start]' and 'sweep[{name}][stop]' "
+                f"must be numbers.")
+        return num
+
+    if not isinstance(spec, list) or not spec:
+        raise ProcessorExecuteError(
+            f"Value 'sweep[{name}]' must be a non empty list or a range.")
+    if any(isinstance(v, bool) or not isinstance(v, (int, float))
+           for v in spec):
+        raise ProcessorExecuteError(
+            f"Values of 'sweep[{name}]' must be numbers.")
+    return len(spec)
+
+
+def sweep_values(name: str, spec) -> List[float]:
+    """
+    Get the values of a swept parameter
+
+    The values are given either as a list, e.g. `[1.0e8, 1.5e8]`, or as
+    a range of evenly spaced values, e.g.
+    `{"start": 1.0e8, "stop": 2.0e8, "num": 5}` (both ends included).
+
+    :param name: name of the parameter
+    :param spec: list or range of values
+
+    :returns: the values of the parameter
+    """
+    num = sweep_length(name, spec)
+    if isinstance(spec, dict):
+        return np.linspace(float(spec['start']), float(spec['stop']),
+                           num).tolist()
+    return [float(v) for v in spec]
+
+
+def sweep_grid(sweep: dict, max_runs: int
+               ) -> Tuple[List[str], List[Tuple[float, ...]]]:
+    """
+    Expand a sweep in the grid of its runs
+
+    The runs are the cartesian product of the values of the swept
+    parameters, with the last parameter varying fastest. Their number is
+    checked against `max_runs` before any value is built.
+
+    :param sweep: values of each swept parameter, by parameter name
+    :param max_runs: max number of runs
+
+    :returns: the names of the swept parameters and, for each run, the
+        values of the parameters in the same order
+    """
+    if not isinstance(sweep, dict) or not sweep:
+        raise ProcessorExecuteError(
+            "Value 'sweep' must define at least one parameter.")
+    names = list(sweep)
+
+    runs = 1
+    for name in names:
+        runs *= sweep_length(name, sweep[name])
+    if runs > max_runs:
+        raise ProcessorExecuteError(
+            f"The sweep requires {runs} runs, more than the allowed "
+            f"{max_runs}.")
+
+    values = [sweep_values(name, sweep[name]) for name in names]
+    return names, list(itertools.product(*values))
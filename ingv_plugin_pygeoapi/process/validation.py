@@ -0,0 +1,443 @@
+# =================================================================
+#
+# Authors: Francesco Martinelli <francesco.martinelli@ingv.it>
+#
+# Copyright (c) 2026 Francesco Martinelli
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from pygeoapi.process.base import ProcessorExecuteError
+
+# Funzione di verifica di un valore: solleva ProcessorExecuteError
+# se il valore non rispetta lo schema; il secondo argomento è il nome
+# del valore usato nei messaggi di errore, es. 'components[p]'
+Check = Callable[[Any, str], None]
+
+# Tipi JSON Schema -> verifica del tipo Python prodotto dal parser JSON
+_JSON_TYPES = {
+    'string': lambda v: isinstance(v, str),
+    'number': lambda v: (isinstance(v, (int, float))
+                         and not isinstance(v, bool)),
+    'integer': lambda v: isinstance(v, int) and not isinstance(v, bool),
+    'boolean': lambda v: isinstance(v, bool),
+    'array': lambda v: isinstance(v, (list, tuple)),
+    'object': lambda v: isinstance(v, dict),
+    'null': lambda v: v is None
+}
+
+# Massimo numero di valori non validi elencati nel messaggio di errore
+MAX_REPORTED_ERRORS = 20
+
+# Chiavi ammesse negli schemi delle righe di un input tabellare
+_TABLE_ROW_KEYS = {'type', 'items', 'minItems', 'maxItems',
+                   'title', 'description'}
+_TABLE_CELL_KEYS = {'type', 'pattern', 'title', 'description'}
+
+_VALIDATORS = {}
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def _is_number(value) -> bool:
+    return _JSON_TYPES['number'](value)
+
+
+def _type_check(types) -> Check:
+    if isinstance(types, str):
+        types = [types]
+    checks = [_JSON_TYPES[t] for t in types]
+    expected = ' or '.join(types)
+
+    def check(value, name):
+        if not any(c(value) for c in checks):
+            raise ProcessorExecuteError(
+                f"Value '{name}' must be of type {expected}.")
+    return check
+
+
+def _enum_check(allowed: list) -> Check:
+    def check(value, name):
+        # True == 1: i booleani sono confrontati solo con booleani
+        if not any(value == a and isinstance(value, bool) == isinstance(a, bool)
+                   for a in allowed):
+            raise ProcessorExecuteError(
+                f"Value '{name}' must be one of: "
+                f"{', '.join(map(str, allowed))}.")
+    return check
+
+
+def _bounds_check(schema: dict) -> Check:
+    # 'exclusiveMinimum'/'exclusiveMaximum' booleani (OpenAPI 3.0), che
+    # modificano 'minimum'/'maximum', oppure numerici (JSON Schema 2020-12)
+    bounds = []
+    for key, exclusive_key, symbol in (('minimum', 'exclusiveMinimum', '>'),
+                                       ('maximum', 'exclusiveMaximum', '<')):
+        exclusive = schema.get(exclusive_key, False)
+        if key in schema:
+            bounds.append((symbol, schema[key], exclusive is True))
+        if _is_number(exclusive):
+            bounds.append((symbol, exclusive, True))
+
+    def respects(value, symbol, bound, exclusive):
+        if symbol == '>':
+            return value > bound if exclusive else value >= bound
+        return value < bound if exclusive else value <= bound
+
+    condition = ' and '.join(
+        f"{symbol}{'' if exclusive else '='}{bound}"
+        for symbol, bound, exclusive in bounds)
+
+    def check(value, name):
+        if _is_number(value) and not all(respects(value, *b) for b in bounds):
+            raise ProcessorExecuteError(
+                f"Value '{name}' must be {condition}.")
+    return check
+
+
+def _string_check(schema: dict) -> Check:
+    regex = re.compile(schema['pattern']) if 'pattern' in schema else None
+    min_length = schema.get('minLength', 0)
+    max_length = schema.get('maxLength')
+
+    def check(value, name):
+        if not isinstance(value, str):
+            return
+        if regex is not None and not regex.search(value):
+            raise ProcessorExecuteError(
+                f"Value '{name}' not correctly formatted: '{value}'.")
+        if len(value) < min_length or (max_length is not None
+                                       and len(value) > max_length):
+            raise ProcessorExecuteError(
+                f"Value '{name}' has a wrong length: {len(value)}.")
+    return check
+
+
+def _array_check(schema: dict) -> Check:
+    min_items = schema.get('minItems', 0)
+    max_items = schema.get('maxItems')
+    items = compile_schema(schema['items']) if 'items' in schema else None
+
+    def check(value, name):
+        if not isinstance(value, (list, tuple)):
+            return
+        if len(value) < min_items or (max_items is not None
+                                      and len(value) > max_items):
+            raise ProcessorExecuteError(
+                f"Value '{name}' has a wrong number of items: "
+                f"{len(value)}.")
+        if items is not None:
+            for index, item in enumerate(value):
+                items(item, f'{name}[{index}]')
+    return check
+
+
+def _object_check(schema: dict) -> Check:
+    required = list(schema.get('required', []))
+    properties = {key: compile_schema(sub_schema)
+                  for key, sub_schema in schema.get('properties', {}).items()}
+    additional = schema.get('additionalProperties', True)
+    additional_check = (compile_schema(additional)
+                        if isinstance(additional, dict) else None)
+
+    def check(value, name):
+        if not isinstance(value, dict):
+            return
+        missing = [key for key in required if key not in value]
+        if missing:
+            raise ProcessorExecuteError(
+                f"Value '{name}' does not contain the required parameters: "
+                f"{', '.join(missing)}.")
+        if additional is False:
+            extra = [key for key in value if key not in properties]
+            if extra:
+                raise ProcessorExecuteError(
+                    f"Value '{name}' contains unexpected parameters: "
+                    f"{', '.join(extra)}.")
+        for key, item in value.items():
+            item_check = properties.get(key, additional_check)
+            if item_check is not None:
+                item_check(item, f'{name}[{key}]')
+    return check
+
+
+def _one_of_check(schemas: List[dict], exactly_one: bool) -> Check:
+    alternatives = [compile_schema(s) for s in schemas]
+
+    def check(value, name):
+        errors = []
+        for alternative in alternatives:
+            try:
+                alternative(value, name)
+            except ProcessorExecuteError as err:
+                errors.append(str(err))
+        matches = len(alternatives) - len(errors)
+        if matches == 0:
+            raise ProcessorExecuteError(
+                f"Value '{name}' does not match any of the allowed schemas: "
+                f"{' / '.join(dict.fromkeys(errors))}")
+        if exactly_one and matches > 1:
+            raise ProcessorExecuteError(
+                f"Value '{name}' matches more than one of the allowed "
+                f"schemas.")
+    return check
+
+
+def compile_schema(schema: dict) -> Check:
+    """
+    Compile the JSON Schema of an input into a checking function
+
+    The schema is walked once: the returned function only runs the
+    checks of the keywords present in the schema. The keywords used by
+    the process descriptions are supported: 'type', 'enum', 'minimum',
+    'maximum', 'exclusiveMinimum', 'exclusiveMaximum', 'pattern',
+    'minLength', 'maxLength', 'items', 'minItems', 'maxItems',
+    'required', 'properties', 'additionalProperties', 'oneOf', 'anyOf'
+    and 'allOf'; the others (e.g. 'description') are ignored.
+
+    :param schema: JSON Schema of the value
+
+    :returns: function `check(value, name)` raising
+        `ProcessorExecuteError` if the value does not match the schema
+    """
+    checks = []
+    if 'type' in schema:
+        checks.append(_type_check(schema['type']))
+    if 'enum' in schema:
+        checks.append(_enum_check(list(schema['enum'])))
+    if {'minimum', 'maximum', 'exclusiveMinimum',
+            'exclusiveMaximum'}.intersection(schema):
+        checks.append(_bounds_check(schema))
+    if {'pattern', 'minLength', 'maxLength'}.intersection(schema):
+        checks.append(_string_check(schema))
+    if {'items', 'minItems', 'maxItems'}.intersection(schema):
+        checks.append(_array_check(schema))
+    if {'required', 'properties', 'additionalProperties'}.intersection(
+            schema):
+        checks.append(_object_check(schema))
+    if 'oneOf' in schema:
+        checks.append(_one_of_check(schema['oneOf'], exactly_one=True))
+    if 'anyOf' in schema:
+        checks.append(_one_of_check(schema['anyOf'], exactly_one=False))
+    for sub_schema in schema.get('allOf', []):
+        checks.append(compile_schema(sub_schema))
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value, name):
+        for c in checks:
+            c(value, name)
+    return check
+
+
+def compile_table_check(schema: dict
+                        ) -> Optional[Callable[[list, str], str]]:
+    """
+    Compile a bulk check for the rows of a table input
+
+    A table input has as occurrences rows of a fixed number of strings,
+    matching the same anchored pattern (e.g. the rows of SOLWCAD
+    `sw.data`). The rows are joined in a text, each value followed by a
+    tab and each row by a newline, and the whole text is checked by a
+    single regular expression; only if it does not match, the values are
+    checked one by one to report all the wrong ones.
+
+    :param schema: JSON Schema of a row
+
+    :returns: function `check(rows, name)` returning the text of the
+        table, or `None` if the schema does not describe a table row
+    """
+    items = schema.get('items')
+    if (schema.get('type') != 'array' or not isinstance(items, dict)
+            or set(schema) - _TABLE_ROW_KEYS
+            or set(items) - _TABLE_CELL_KEYS
+            or items.get('type') != 'string'):
+        return None
+    columns = schema.get('minItems')
+    pattern = items.get('pattern', '')
+    if (columns is None or schema.get('maxItems') != columns
+            or not pattern.startswith('^') or not pattern.endswith('$')
+            or pattern.endswith('\\$')):
+        return None
+
+    cell = pattern[1:-1]
+    if not re.search(r'\[[^\]]*\(', cell):
+        # i gruppi non catturanti sono più veloci
+        cell = re.sub(r'(?<!\\)\((?!\?)', '(?:', cell)
+    table = re.compile(f'(?:(?:(?:{cell})\t){{{columns}}}\n)*')
+    row_check = compile_schema(schema)
+    cell_check = compile_schema(items)
+
+    def check(rows, name):
+        text = None
+        if all(isinstance(row, (list, tuple)) and len(row) == columns
+               for row in rows):
+            try:
+                text = ''.join(['\t'.join(row) + '\t\n' for row in rows])
+            except TypeError:
+                # valori non stringa
+                text = None
+        # I separatori contati escludono valori contenenti tab o newline
+        if (text is not None
+                and text.count('\n') == len(rows)
+                and text.count('\t') == len(rows) * columns
+                and table.fullmatch(text)):
+            return text
+
+        errors = []
+        for index, row in enumerate(rows):
+            row_name = f'{name}[{index}]'
+            if not isinstance(row, (list, tuple)) or len(row) != columns:
+                try:
+                    row_check(row, row_name)
+                except ProcessorExecuteError as err:
+                    errors.append(str(err))
+                continue
+            for column, value in enumerate(row):
+                try:
+                    cell_check(value, f'{row_name}[{column}]')
+                except ProcessorExecuteError as err:
+                    errors.append(str(err))
+        if not errors:
+            # e.g. un valore con un newline finale, accettato da '$'
+            errors.append(f"Value '{name}' not correctly formatted.")
+        reported = ' '.join(errors[:MAX_REPORTED_ERRORS])
+        if len(errors) > MAX_REPORTED_ERRORS:
+            reported += f' ... ({len(errors)} errors)'
+        raise ProcessorExecuteError(reported)
+    return check
+
+
+def _unwrap(value):
+    # Valore 'qualificato' di un input: {"value": ..., ...}
+    if isinstance(value, dict) and 'value' in value:
+        return value['value']
+    return value
+
+
+class InputValidator:
+    """Validator of the inputs of a process, from its description"""
+    def __init__(self, inputs: dict):
+        """
+        Initialize object
+
+        :param inputs: 'inputs' of the process metadata
+        """
+        self._inputs = {}
+        self._tables = {}
+        for input_id, definition in inputs.items():
+            max_occurs = definition.get('maxOccurs', 1)
+            self._inputs[input_id] = (
+                int(definition.get('minOccurs', 1)),
+                None if max_occurs == 'unbounded' else int(max_occurs),
+                compile_schema(definition.get('schema', {}))
+            )
+            if max_occurs != 1:
+                table_check = compile_table_check(
+                    definition.get('schema', {}))
+                if table_check is not None:
+                    self._tables[input_id] = table_check
+
+    def __call__(self, data: dict) -> Dict[str, str]:
+        """
+        Validate the inputs of an execution request
+
+        :param data: `data` parameter of `execute()`
+
+        :returns: the text of the table inputs (see
+            `compile_table_check()`), by input id, to be written as is
+            in the input files of the 'code'
+        """
+        if not isinstance(data, dict):
+            raise ProcessorExecuteError('Input not correctly formatted.')
+
+        extra_keys = [key for key in data if key not in self._inputs]
+        if extra_keys:
+            raise ProcessorExecuteError(
+                f"Input contains unexpected parameters: "
+                f"{', '.join(extra_keys)}.")
+
+        tables = {}
+        for input_id, (min_occurs, max_occurs, check) in self._inputs.items():
+            if input_id not in data:
+                if min_occurs > 0:
+                    raise ProcessorExecuteError(
+                        f"Input '{input_id}' must be provided.")
+                continue
+
+            value = data[input_id]
+            # Con maxOccurs > 1 una lista contiene le occorrenze dell'input
+            if max_occurs != 1 and isinstance(value, list):
+                occurrences = value
+            else:
+                occurrences = [value]
+            if len(occurrences) < min_occurs or (
+                    max_occurs is not None and len(occurrences) > max_occurs):
+                raise ProcessorExecuteError(
+                    f"Input '{input_id}' has a wrong number of values: "
+                    f"{len(occurrences)}.")
+
+            if input_id in self._tables:
+                tables[input_id] = self._tables[input_id](
+                    [_unwrap(occurrence) for occurrence in occurrences],
+                    input_id)
+            elif len(occurrences) == 1 and occurrences[0] is value:
+                check(_unwrap(value), input_id)
+            else:
+                for index, occurrence in enumerate(occurrences):
+                    check(_unwrap(occurrence), f'{input_id}[{index}]')
+        return tables
+
+    def check_input(self, input_id: str, value) -> None:
+        """
+        Validate one value of an input
+
+        :param input_id: id of the input
+        :param value: the value, not qualified
+        """
+        self._inputs[input_id][2](value, input_id)
+
+
+def get_input_validator(process_metadata: dict) -> InputValidator:
+    """
+    Return the validator of the inputs of a process
+
+    The schemas are compiled once for each process id and version, and
+    shared by all the processor instances.
+
+    :param process_metadata: process metadata `dict`
+
+    :returns: `InputValidator`
+    """
+    key = (process_metadata['id'], process_metadata['version'])
+    with _VALIDATORS_LOCK:
+        validator = _VALIDATORS.get(key)
+        if validator is None:
+            validator = _VALIDATORS[key] = InputValidator(
+                process_metadata['inputs'])
+    return validator
@@ -17,8 +17,8 @@ setup(
     packages=find_packages(include=["ingv_plugin_pygeoapi", "ingv_plugin_pygeoapi.*"]),  # include pygeoapi e sottopacchetti
     python_requires=">=3.12",         # versione minima di Python
     install_requires=[               # dipendenze richieste
-        # "requests>=2.28",
-        # "numpy>=1.25",
+        "requests>=2.28",
+        "numpy>=1.25",
     ],
     classifiers=[
         "Programming Language :: Python :: 3",